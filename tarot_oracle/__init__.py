@@ -1,19 +1,8 @@
 """Tarot Oracle - AI-powered tarot divination system."""
 
-from .tarot import (
-    TarotDivination,
-    SpreadRenderer,
-    SPREADS,
-    resolve_spread,
-    Card,
-    MAJOR_ARCANA,
-    MINOR_ARCANA,
-    SEMANTICS,
-    DeckLoader,
-    SemanticAdapter,
-)
-from .oracle import Oracle
-from .config import Config
+from importlib import import_module
+from typing import Any
+
 # Custom exceptions removed - using standard TypeError and ValueError instead
 
 __version__ = "0.1.0"
@@ -31,3 +20,34 @@ __all__ = [
     "Oracle",
     "Config",
 ]
+
+# Public names are resolved on first access so that importing a submodule
+# (e.g. the CLI for --help) does not pull in the LLM client dependencies.
+_EXPORT_MODULES = {
+    "TarotDivination": ".tarot",
+    "SpreadRenderer": ".tarot",
+    "SPREADS": ".tarot",
+    "resolve_spread": ".tarot",
+    "Card": ".tarot",
+    "MAJOR_ARCANA": ".tarot",
+    "MINOR_ARCANA": ".tarot",
+    "SEMANTICS": ".tarot",
+    "DeckLoader": ".tarot",
+    "SemanticAdapter": ".tarot",
+    "Oracle": ".oracle",
+    "Config": ".config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and cache public package attributes."""
+    if name not in _EXPORT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORT_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported exports."""
+    return sorted(set(globals()) | set(__all__))
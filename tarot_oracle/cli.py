@@ -1,20 +1,62 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser, Namespace
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
-from tarot_oracle.oracle import main as oracle_main
-from tarot_oracle.tarot import main as tarot_main
+from tarot_oracle import __version__
 
 import sys
 
 # Custom exceptions removed - using standard TypeError and ValueError instead
 
 
-def create_unified_parser() -> ArgumentParser:
+def oracle_main(args: list[str] | None = None) -> int:
+    """Run the oracle CLI, importing its LLM client dependencies on demand."""
+    from tarot_oracle.oracle import main
+    return main(args)
+
+
+def tarot_main(args: list[str] | None = None) -> int:
+    """Run the tarot CLI, importing the deck machinery on demand."""
+    from tarot_oracle.tarot import main
+    return main(args)
+
+
+_SUBCOMMANDS = ("reading", "deck", "invocation", "spread")
+_SUBCOMMAND_NAMES = frozenset(_SUBCOMMANDS)
+_PROVIDER_CHOICES = ("gemini", "openrouter", "ollama")
+_DEFAULT_PROVIDER = "gemini"
+_DEFAULT_SPREAD = "3-card"
+_DEFAULT_RANDOM_BYTES = 8
+_RANDOM_HELP = f"Add N random bytes to RNG seed for entropy (default: {_DEFAULT_RANDOM_BYTES})"
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named by the first positional token in argv, or
+        None if there is none.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMAND_NAMES else None
+    return None
+
+
+def create_unified_parser(argv: list[str] | None = None) -> ArgumentParser:
     """Create the main unified CLI argument parser with support for multiple
         subcommands including reading, deck management, and spread
-        configuration.
+        configuration. If argv is given, only the subcommand it names gets its
+        arguments registered; the others are listed for help only. Parsers
+        are cached and shared, so callers must not mutate them.
+    """
+    selected = _SUBCOMMANDS if argv is None else (_sniff_subcommand(argv),)
+    return _build_unified_parser(selected)
+
+
+@lru_cache(maxsize=None)
+def _build_unified_parser(selected: tuple[str | None, ...]) -> ArgumentParser:
+    """Build the unified parser, registering arguments only for the
+        subcommands in selected.
     """
     parser = ArgumentParser(
         prog="tarot-oracle",
@@ -22,7 +64,7 @@ def create_unified_parser() -> ArgumentParser:
     )
 
     # Add version argument
-    parser.add_argument("--version", action="version", version="tarot-oracle 0.1.0")
+    parser.add_argument("--version", action="version", version=f"tarot-oracle {__version__}")
 
     # Create subparsers for different commands
     subparsers = parser.add_subparsers(
@@ -39,7 +81,8 @@ def create_unified_parser() -> ArgumentParser:
         help="Perform divinatory tarot readings with optional AI interpretation",
         description="Complete oracle functionality with AI-powered interpretation using Gemini, OpenRouter, or Ollama",
     )
-    _add_reading_arguments(reading_parser)
+    if "reading" in selected:
+        _add_reading_arguments(reading_parser)
 
     # Deck subcommand (tarot deck functionality)
     deck_parser = subparsers.add_parser(
@@ -47,7 +90,8 @@ def create_unified_parser() -> ArgumentParser:
         help="Manage tarot decks and perform basic readings",
         description="Work with tarot decks, list available decks, and perform basic card readings",
     )
-    _add_deck_arguments(deck_parser)
+    if "deck" in selected:
+        _add_deck_arguments(deck_parser)
 
     # Invocation subcommand
     invocation_parser = subparsers.add_parser(
@@ -55,7 +99,8 @@ def create_unified_parser() -> ArgumentParser:
         help="Manage custom invocations for readings",
         description="List and manage custom invocation texts",
     )
-    _add_invocation_arguments(invocation_parser)
+    if "invocation" in selected:
+        _add_invocation_arguments(invocation_parser)
 
     # Spread subcommand
     spread_parser = subparsers.add_parser(
@@ -63,153 +108,154 @@ def create_unified_parser() -> ArgumentParser:
         help="Manage custom spread layouts",
         description="List and manage custom tarot spread configurations",
     )
-    _add_spread_arguments(spread_parser)
+    if "spread" in selected:
+        _add_spread_arguments(spread_parser)
 
     return parser
 
 
-def _add_reading_arguments(parser: ArgumentParser) -> None:
-    """Add arguments for the reading subcommand including AI provider,
-        interpretation options, and spread types.
-    """
-    # Core question and spread
-    parser.add_argument("question", help="Question for the oracle")
-    parser.add_argument(
-        "--spread",
-        default="3-card",
-        help="Spread layout (default: 3-card). Available: 3-card, cross, celtic, single, crowley or custom",
-    )
+# Argument specs are (group, flags, kwargs) rows. group is None for a plain
+# argument, or "exclusive"/"required" to add it to the parser's (required)
+# mutually exclusive group.
+_ArgSpecs = tuple[tuple[str | None, tuple[str, ...], dict[str, Any]], ...]
 
+_READING_ARG_SPECS: _ArgSpecs = (
+    # Core question and spread
+    (None, ("question",), {"help": "Question for the oracle"}),
+    (None, ("--spread",), {
+        "default": _DEFAULT_SPREAD,
+        "help": f"Spread layout (default: {_DEFAULT_SPREAD}). Available: 3-card, cross, celtic, single, crowley or custom",
+    }),
     # Oracle-specific features
-    parser.add_argument(
-        "--provider",
-        choices=["gemini", "openrouter", "ollama"],
-        default="gemini",
-        help="LLM provider (default: gemini)",
-    )
-    parser.add_argument(
-        "--invocation",
-        help="Custom invocation text (defaults to Hermes-Thoth/Prometheus if not provided)",
-    )
-    parser.add_argument("--invocation-name", help="Name of custom invocation to load")
-    parser.add_argument(
-        "--interpret",
-        action="store_true",
-        help="Generate LLM interpretation of reading",
-    )
-    parser.add_argument("--model", help="Model name (provider-specific)")
-
+    (None, ("--provider",), {
+        "choices": _PROVIDER_CHOICES,
+        "default": _DEFAULT_PROVIDER,
+        "help": f"LLM provider (default: {_DEFAULT_PROVIDER})",
+    }),
+    (None, ("--invocation",), {
+        "help": "Custom invocation text (defaults to Hermes-Thoth/Prometheus if not provided)",
+    }),
+    (None, ("--invocation-name",), {"help": "Name of custom invocation to load"}),
+    (None, ("--interpret",), {
+        "action": "store_true",
+        "help": "Generate LLM interpretation of reading",
+    }),
+    (None, ("--model",), {"help": "Model name (provider-specific)"}),
     # Provider-specific options
-    parser.add_argument("--api-key", help="API key (for gemini or openrouter provider)")
-    parser.add_argument("--ollama-host", help="Ollama host (for ollama provider)")
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        help="Timeout in seconds (default: 30 gemini, 300 ollama)",
-    )
-
+    (None, ("--api-key",), {"help": "API key (for gemini or openrouter provider)"}),
+    (None, ("--ollama-host",), {"help": "Ollama host (for ollama provider)"}),
+    (None, ("--timeout",), {
+        "type": int,
+        "help": "Timeout in seconds (default: 30 gemini, 300 ollama)",
+    }),
     # Session saving options
-    save_group = parser.add_mutually_exclusive_group()
-    save_group.add_argument(
-        "--save",
-        action="store_true",
-        help="Force save this session (overrides environment settings)",
-    )
-    save_group.add_argument(
-        "--no-save",
-        action="store_true",
-        help="Do not save this session (overrides environment settings)",
-    )
-    parser.add_argument(
-        "--save-path", help="Override default save location for this session"
-    )
-
+    ("exclusive", ("--save",), {
+        "action": "store_true",
+        "help": "Force save this session (overrides environment settings)",
+    }),
+    ("exclusive", ("--no-save",), {
+        "action": "store_true",
+        "help": "Do not save this session (overrides environment settings)",
+    }),
+    (None, ("--save-path",), {"help": "Override default save location for this session"}),
     # Tarot options
-    parser.add_argument(
-        "--random",
-        type=int,
-        default=8,
-        help="Add N random bytes to RNG seed for entropy (default: 8)",
-    )
-    parser.add_argument(
-        "--reversed", action="store_true", help="Allow cards to appear reversed"
-    )
+    (None, ("--random",), {
+        "type": int,
+        "default": _DEFAULT_RANDOM_BYTES,
+        "help": _RANDOM_HELP,
+    }),
+    (None, ("--reversed",), {"action": "store_true", "help": "Allow cards to appear reversed"}),
+)
+
+_DECK_ARG_SPECS: _ArgSpecs = (
+    # Main operations
+    ("required", ("--list",), {
+        "action": "store_true",
+        "dest": "list_decks",
+        "help": "List available deck configurations",
+    }),
+    ("required", ("--lookup",), {
+        "metavar": "CODES",
+        "help": "Look up card codes (e.g., '0,I,W_A,C_K'). Format: comma-separated notation",
+    }),
+    ("required", ("question",), {
+        "nargs": "?",
+        "help": "Question for tarot reading (required for reading mode)",
+    }),
+    # General options
+    (None, ("--spread",), {
+        "default": _DEFAULT_SPREAD,
+        "help": f"Spread layout (default: {_DEFAULT_SPREAD})",
+    }),
+    (None, ("--deck",), {"metavar": "FILENAME", "help": "Use custom deck configuration"}),
+    (None, ("--json",), {"action": "store_true", "help": "Output in JSON format"}),
+    (None, ("--reversed",), {"action": "store_true", "help": "Allow reversed cards"}),
+    (None, ("--random",), {
+        "type": int,
+        "default": _DEFAULT_RANDOM_BYTES,
+        "help": _RANDOM_HELP,
+    }),
+)
+
+_INVOCATION_ARG_SPECS: _ArgSpecs = (
+    ("required", ("--list",), {
+        "action": "store_true",
+        "dest": "list_invocations",
+        "help": "List available custom invocations",
+    }),
+    ("required", ("--show",), {"metavar": "NAME", "help": "Display content of a specific invocation"}),
+)
+
+_SPREAD_ARG_SPECS: _ArgSpecs = (
+    ("required", ("--list",), {
+        "action": "store_true",
+        "dest": "list_spreads",
+        "help": "List available custom spreads",
+    }),
+    ("required", ("--show",), {"metavar": "NAME", "help": "Display configuration of a specific spread"}),
+)
+
+
+def _add_argument_specs(parser: ArgumentParser, specs: _ArgSpecs) -> None:
+    """Register argument specs on parser in order, creating its mutually
+        exclusive group on first use.
+    """
+    group = None
+    for group_kind, flags, kwargs in specs:
+        if group_kind is None:
+            parser.add_argument(*flags, **kwargs)
+            continue
+        if group is None:
+            group = parser.add_mutually_exclusive_group(required=group_kind == "required")
+        group.add_argument(*flags, **kwargs)
+
+
+def _add_reading_arguments(parser: ArgumentParser) -> None:
+    """Add arguments for the reading subcommand including AI provider,
+        interpretation options, and spread types.
+    """
+    _add_argument_specs(parser, _READING_ARG_SPECS)
 
 
 def _add_deck_arguments(parser: ArgumentParser) -> None:
     """Add arguments for the deck subcommand including listing decks and
         performing basic readings.
     """
-    # Create mutually exclusive group for main operations
-    operation_group = parser.add_mutually_exclusive_group(required=True)
-
-    operation_group.add_argument(
-        "--list",
-        action="store_true",
-        dest="list_decks",
-        help="List available deck configurations",
-    )
-    operation_group.add_argument(
-        "--lookup",
-        metavar="CODES",
-        help="Look up card codes (e.g., '0,I,W_A,C_K'). Format: comma-separated notation",
-    )
-    operation_group.add_argument(
-        "question",
-        nargs="?",
-        help="Question for tarot reading (required for reading mode)",
-    )
-
-    # General options
-    parser.add_argument(
-        "--spread", default="3-card", help="Spread layout (default: 3-card)"
-    )
-    parser.add_argument(
-        "--deck", metavar="FILENAME", help="Use custom deck configuration"
-    )
-    parser.add_argument("--json", action="store_true", help="Output in JSON format")
-    parser.add_argument("--reversed", action="store_true", help="Allow reversed cards")
-    parser.add_argument(
-        "--random",
-        type=int,
-        default=8,
-        help="Add N random bytes to RNG seed for entropy (default: 8)",
-    )
+    _add_argument_specs(parser, _DECK_ARG_SPECS)
 
 
 def _add_invocation_arguments(parser: ArgumentParser) -> None:
     """Add arguments for the invocation subcommand including listing
         available custom invocations.
     """
-
-    operation_group = parser.add_mutually_exclusive_group(required=True)
-
-    operation_group.add_argument(
-        "--list",
-        action="store_true",
-        dest="list_invocations",
-        help="List available custom invocations",
-    )
-    operation_group.add_argument(
-        "--show", metavar="NAME", help="Display content of a specific invocation"
-    )
+    _add_argument_specs(parser, _INVOCATION_ARG_SPECS)
 
 
 def _add_spread_arguments(parser: ArgumentParser) -> None:
     """Add arguments for the spread subcommand including listing available
         custom spreads.
     """
-    operation_group = parser.add_mutually_exclusive_group(required=True)
-
-    operation_group.add_argument(
-        "--list",
-        action="store_true",
-        dest="list_spreads",
-        help="List available custom spreads",
-    )
-    operation_group.add_argument(
-        "--show", metavar="NAME", help="Display configuration of a specific spread"
-    )
+    _add_argument_specs(parser, _SPREAD_ARG_SPECS)
 
 
 def handle_reading_command(args: Namespace) -> int:
@@ -240,7 +286,7 @@ def handle_reading_command(args: Namespace) -> int:
         oracle_args.append("--no-save")
     if args.save_path:
         oracle_args.extend(["--save-path", args.save_path])
-    if args.random != 8:
+    if args.random != _DEFAULT_RANDOM_BYTES:
         oracle_args.extend(["--random", str(args.random)])
     if args.reversed:
         oracle_args.append("--reversed")
@@ -292,7 +338,7 @@ def handle_deck_command(args: Namespace) -> int:
         tarot_args.append("--json")
     if args.reversed:
         tarot_args.append("--reversed")
-    if args.random != 8:
+    if args.random != _DEFAULT_RANDOM_BYTES:
         tarot_args.extend(["--random", str(args.random)])
 
     return cast(int, tarot_main(tarot_args))
@@ -314,7 +360,7 @@ def handle_invocation_command(args: Namespace) -> int:
 
         print("Available custom invocations:")
         for invocation in invocations:
-            print(f"  {invocation['name']:<20} - {invocation['description']}")
+            print(f"  {invocation['name']:<20} - {invocation['preview']}")
         return 0
 
     elif args.show:
@@ -354,7 +400,7 @@ def handle_spread_command(args: Namespace) -> int:
         if spread_config:
             import json
             print(f"=== Spread: {args.show} ===")
-            print(json.dumps(spread_config, indent=2, ensure_ascii=False))
+            print(json.dumps(dict(spread_config), indent=2, ensure_ascii=False))
             return 0
         else:
             print(f"Spread '{args.show}' not found.")
@@ -363,29 +409,34 @@ def handle_spread_command(args: Namespace) -> int:
     return 0
 
 
+_COMMAND_HANDLERS = {
+    "reading": handle_reading_command,
+    "deck": handle_deck_command,
+    "invocation": handle_invocation_command,
+    "spread": handle_spread_command,
+}
+
+
 def main(args: list[str] | None = None) -> int:
     """Main entry point for unified CLI, processing command-line arguments
-        and dispatching to appropriate command handlers, returning exit code.
+        (sys.argv[1:] when args is None) and dispatching to appropriate
+        command handlers, returning exit code.
     """
-    parser = create_unified_parser()
-
     if args is None:
-        parsed_args = parser.parse_args()
-    else:
-        parsed_args = parser.parse_args(args)
+        args = sys.argv[1:]
+
+    # Answer a bare --version without building any parser
+    if args == ["--version"]:
+        print(f"tarot-oracle {__version__}")
+        return 0
+
+    parser = create_unified_parser(args)
+    parsed_args = parser.parse_args(args)
 
     try:
-        if parsed_args.command == "reading":
-            return handle_reading_command(parsed_args)
-        elif parsed_args.command == "deck":
-            return handle_deck_command(parsed_args)
-        elif parsed_args.command == "invocation":
-            return handle_invocation_command(parsed_args)
-        elif parsed_args.command == "spread":
-            return handle_spread_command(parsed_args)
-        else:
-            parser.print_help()
-            return 1
+        # The subparsers are required, so argparse has already rejected
+        # anything other than the known commands
+        return _COMMAND_HANDLERS[parsed_args.command](parsed_args)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.", file=sys.stderr)
@@ -1,7 +1,42 @@
-import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import json
+
+
+def _dumps_indented(data: dict[str, Any]) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=None)
+def _read_resource(resource_path: str) -> str:
+    """Read a bundled package resource as text, once per process. Raises
+        FileNotFoundError (which is not cached) if it does not exist.
+    """
+    with resources.files("tarot_oracle").joinpath(resource_path).open("r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _list_resource_stems(dir_path: str) -> tuple[str, ...]:
+    """Return the sorted JSON file stems in a bundled package directory,
+        scanning it once per process. Returns () if it does not exist.
+    """
+    try:
+        directory = resources.files("tarot_oracle").joinpath(dir_path)
+        return tuple(sorted(f.stem for f in directory.iterdir() if f.suffix == ".json"))
+    except FileNotFoundError:
+        return ()
+
 
 class BundledDataLoader:
     """Load bundled JSON data from the tarot_oracle package.
@@ -11,20 +46,16 @@ class BundledDataLoader:
     @staticmethod
     def load_deck(name: str) -> dict[str, Any] | None:
         """Load bundled deck configuration by name. Returns dict or None if not found."""
-        resource_path = f"data/decks/{name}.json"
         try:
-            with resources.files("tarot_oracle").joinpath(resource_path).open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(_read_resource(f"data/decks/{name}.json"))
         except FileNotFoundError:
             return None
 
     @staticmethod
     def load_spread(name: str) -> dict[str, Any] | None:
         """Load bundled spread configuration by name. Returns dict or None if not found."""
-        resource_path = f"data/spreads/{name}.json"
         try:
-            with resources.files("tarot_oracle").joinpath(resource_path).open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(_read_resource(f"data/spreads/{name}.json"))
         except FileNotFoundError:
             return None
 
@@ -41,18 +72,14 @@ class BundledDataLoader:
     @staticmethod
     def _list_files(dir_path: str) -> list[str]:
         """List JSON file stems in a package directory. Returns empty list if directory not found."""
-        try:
-            directory = resources.files("tarot_oracle").joinpath(dir_path)
-            return [f.stem for f in directory.iterdir() if f.suffix == ".json"]
-        except FileNotFoundError:
-            return []
+        return list(_list_resource_stems(dir_path))
 
     @staticmethod
     def export_deck(name: str) -> str | None:
         """Export bundled deck as JSON string. Returns None if deck not found."""
         deck = BundledDataLoader.load_deck(name)
         if deck:
-            return json.dumps(deck, indent=2)
+            return _dumps_indented(deck)
         return None
 
     @staticmethod
@@ -60,5 +87,5 @@ class BundledDataLoader:
         """Export bundled spread as JSON string. Returns None if spread not found."""
         spread = BundledDataLoader.load_spread(name)
         if spread:
-            return json.dumps(spread, indent=2)
+            return _dumps_indented(spread)
         return None
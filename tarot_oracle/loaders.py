@@ -1,13 +1,35 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from tarot_oracle.config import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import json
+import os
 import re
 
 # Custom exceptions removed - using standard TypeError and ValueError instead
 
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_PLACEHOLDER_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+@lru_cache(maxsize=64)
+def _read_spread_config(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a spread file. The file's mtime and size are part of the cache
+        key, so an edited file is parsed again. The result is a read-only
+        view because it is shared by every caller.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return MappingProxyType(orjson.loads(data) if orjson is not None else json.loads(data))
+
 
 class InvocationLoader:
     """Handles loading and management of custom invocation files.
@@ -24,7 +46,8 @@ class InvocationLoader:
         6. ~/.tarot-oracle/invocations/name.md
     
     Attributes:
-        No persistent attributes - stateless loader design.
+        base_path (Path | None): Directory searched before the user config
+            directory; the current working directory when None.
         
     Example:
         >>> loader = InvocationLoader()
@@ -37,6 +60,12 @@ class InvocationLoader:
         ...     print(f"{item['filename']}: {item['preview']}")
     """
 
+    def __init__(self, base_path: Path | None = None) -> None:
+        """Initialize the loader, searching base_path instead of the current
+            working directory if given.
+        """
+        self.base_path = base_path.resolve() if base_path is not None else None
+
     def load_invocation(self, name: str) -> str | None:
         """Load invocation text by name using search order with security validation:
         
@@ -49,15 +78,16 @@ class InvocationLoader:
          6. ~/.tarot-oracle/invocations/{name}.md
          """
         # Sanitize filename to prevent path traversal
-        safe_name = re.sub(r'[^a-zA-Z0-9._-]', '', name)
+        safe_name = _UNSAFE_FILENAME_RE.sub('', name)
         safe_name = safe_name.lstrip('.-')
         if not safe_name:
             return None
-            
+
+        base_path = self.base_path or Path.cwd()
         search_paths = [
-            Path.cwd() / safe_name,
-            Path.cwd() / f"{safe_name}.txt",
-            Path.cwd() / f"{safe_name}.md",
+            base_path / safe_name,
+            base_path / f"{safe_name}.txt",
+            base_path / f"{safe_name}.md",
             config.invocations_dir / safe_name,
             config.invocations_dir / f"{safe_name}.txt",
             config.invocations_dir / f"{safe_name}.md"
@@ -67,7 +97,7 @@ class InvocationLoader:
             if path.exists() and path.is_file():
                 resolved = path.resolve()
                 # Ensure path is within expected directories to prevent path traversal
-                if (resolved.is_relative_to(Path.cwd()) or 
+                if (resolved.is_relative_to(base_path) or 
                     resolved.is_relative_to(config.home_dir)):
                     try:
                         with open(resolved, 'r', encoding='utf-8') as f:
@@ -162,18 +192,27 @@ class SpreadLoader:
         >>> loader.save_spread("3-card-enhanced", new_spread)
     """
 
-    def load_spread(self, name: str) -> dict[str, Any] | None:
+    def __init__(self, base_path: Path | None = None) -> None:
+        """Initialize the loader, searching base_path instead of the current
+            working directory if given.
+        """
+        self.base_path = base_path.resolve() if base_path is not None else None
+
+    def load_spread(self, name: str) -> Mapping[str, Any] | None:
         """Load spread configuration by name using search order with security
             validation from current directory and ~/.tarot-oracle/spreads/.
+            Parsed files are cached until they change and shared between
+            calls, so the top level is returned as a read-only mapping.
         """
         # Sanitize filename to prevent path traversal
-        safe_name = re.sub(r'[^a-zA-Z0-9._-]', '', name)
+        safe_name = _UNSAFE_FILENAME_RE.sub('', name)
         safe_name = safe_name.lstrip('.-')
         if not safe_name:
             return None
-            
+
+        base_path = self.base_path or Path.cwd()
         search_paths = [
-            Path.cwd() / f"{safe_name}.json",
+            base_path / f"{safe_name}.json",
             config.spreads_dir / f"{safe_name}.json"
         ]
 
@@ -181,11 +220,11 @@ class SpreadLoader:
             if path.exists() and path.is_file():
                 resolved = path.resolve()
                 # Ensure path is within expected directories to prevent path traversal
-                if (resolved.is_relative_to(Path.cwd()) or 
+                if (resolved.is_relative_to(base_path) or 
                     resolved.is_relative_to(config.home_dir)):
                     try:
-                        with open(resolved, 'r', encoding='utf-8') as f:
-                            config_data = json.load(f)
+                        stat = resolved.stat()
+                        config_data = _read_spread_config(os.fspath(resolved), stat.st_mtime_ns, stat.st_size)
                         return self._validate_spread_config(config_data, str(path))
                     except (OSError, json.JSONDecodeError, ValueError):
                         continue
@@ -193,7 +232,7 @@ class SpreadLoader:
                     raise ValueError(f"Attempted to access file outside allowed directories: {path}")
         return None
 
-    def _validate_spread_config(self, config: dict[str, Any], path: str) -> dict[str, Any]:
+    def _validate_spread_config(self, config: Mapping[str, Any], path: str) -> Mapping[str, Any]:
         """Validate spread configuration structure and content, returning validated
             config or raising ValueError if invalid.
         """
@@ -280,14 +319,12 @@ class SpreadLoader:
         valid_variables = {
             'water', 'fire', 'air', 'earth', 'spirit'
         }
-        
-        pattern = r'\$\{([^}]+)\}'
-        
+
         for i, row in enumerate(semantics):
             for j, cell in enumerate(row):
                 if isinstance(cell, str):
                     # Find all variable placeholders
-                    matches = re.findall(pattern, cell)
+                    matches = _PLACEHOLDER_RE.findall(cell)
                     for match in matches:
                         if match not in valid_variables:
                             raise ValueError(
@@ -303,14 +340,12 @@ class SpreadLoader:
         valid_variables = {
             'water', 'fire', 'air', 'earth', 'spirit'
         }
-        
-        pattern = r'\$\{([^}]+)\}'
-        
+
         for semantic in semantics:
             for key, value in semantic.items():
                 if isinstance(value, str):
                     # Find all variable placeholders
-                    matches = re.findall(pattern, value)
+                    matches = _PLACEHOLDER_RE.findall(value)
                     for match in matches:
                         if match not in valid_variables:
                             spread_name = config.get('name', 'unknown')
@@ -357,7 +392,7 @@ class SpreadLoader:
         config.spreads_dir.mkdir(parents=True, exist_ok=True)
         
         # Sanitize filename
-        safe_name = re.sub(r'[^a-zA-Z0-9._-]', '', name)
+        safe_name = _UNSAFE_FILENAME_RE.sub('', name)
         safe_name = safe_name.lstrip('.-')
         if not safe_name:
             raise ValueError("Invalid spread name")
@@ -6,9 +6,11 @@ Combines traditional tarot with LLM interpretation via Gemini, OpenRouter, or Ol
 Supports custom invocations, spreads, session saving, and both CLI and programmatic interfaces."""
 
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from sys import stderr
+from threading import Lock, local
 from typing import Any, cast
 
 from tarot_oracle.config import config
@@ -29,15 +31,79 @@ try:
 except ImportError:
     genai = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import json
 import os
 import re
 import requests
 import sys
+import time
 
 # Custom exceptions removed - using standard TypeError and ValueError instead
 
 
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data to a UTF-8 JSON request body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# Chat completion body with only the model and prompt varying between calls;
+# both are substituted as JSON string literals produced by _json_bytes.
+_OPENROUTER_PAYLOAD = (
+    b'{"model":%b,"messages":[{"role":"user","content":%b}],'
+    b'"max_tokens":2048,"temperature":0.7}'
+)
+
+
+class _AlnumTable(dict):
+    """str.translate table that keeps only ASCII letters and digits."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        """Compute and remember the entry for an unseen code point."""
+        char = chr(codepoint)
+        value = codepoint if char.isascii() and char.isalnum() else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _AlnumTable()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket refilling rate tokens per second up to burst.
+        acquire() sleeps only when the caller would exceed the rate.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def drain(self) -> None:
+        """Discard any remaining tokens, e.g. after the server reports a rate limit."""
+        with self.lock:
+            self.tokens = min(self.tokens, 0.0)
+
+
 class InvocationManager:
     """Manages invocations for divinatory readings.
 
@@ -135,41 +201,50 @@ class OpenRouterClient:
     """Client for OpenRouter API marketplace integration.
 
     Uses OpenAI-compatible API for multiple models through unified interface.
-    Supports configurable base URL and model selection."""
+    Supports configurable base URL and model selection. Each thread keeps its
+    own keep-alive session so repeated calls reuse the TLS connection."""
 
-    def __init__(self, api_key: str, model: str = "z-ai/glm-4.5-air:free"):
-        """Initialize OpenRouter client with API key and model."""
+    def __init__(self, api_key: str, model: str = "z-ai/glm-4.5-air:free", requests_per_minute: int | None = 60):
+        """Initialize OpenRouter client with API key and model. Calls are
+            throttled client-side to requests_per_minute; None disables this.
+        """
         self.api_key = api_key
         self.model = model
         self.base_url = "https://openrouter.ai/api/v1"
+        self._local = local()
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/tarot-oracle/tarot-oracle",
+            "X-Title": "Tarot Oracle"
+        }
+        self.rate_limiter = (
+            _TokenBucket(requests_per_minute / 60, requests_per_minute)
+            if requests_per_minute else None
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for the calling thread, created on first use,
+            since requests.Session is not safe to share between threads.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
 
     def generate_response(self, prompt: str, model: str | None = None, timeout: int = 30) -> str | None:
         """Call OpenRouter chat completions endpoint with prompt.
 
         Raises ValueError on API errors (401 for invalid key, 429 for rate limit, network/timeout issues)."""
         url = f"{self.base_url}/chat/completions"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/tarot-oracle/tarot-oracle",
-            "X-Title": "Tarot Oracle"
-        }
-        
-        payload = {
-            "model": model or self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 2048,
-            "temperature": 0.7
-        }
-        
+        body = _OPENROUTER_PAYLOAD % (_json_bytes(model or self.model), _json_bytes(prompt))
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            response = self.session.post(url, data=body, headers=self.headers, timeout=timeout)
             
             if response.status_code == 200:
                 result = response.json()
@@ -181,6 +256,8 @@ class OpenRouterClient:
             elif response.status_code == 401:
                 raise ValueError("Invalid OpenRouter API key")
             elif response.status_code == 429:
+                if self.rate_limiter:
+                    self.rate_limiter.drain()
                 retry_after = response.headers.get('Retry-After')
                 raise ValueError(f"OpenRouter API rate limit exceeded. Retry after: {retry_after}")
             else:
@@ -195,6 +272,15 @@ class OpenRouterClient:
         except Exception as e:
             raise ValueError(f"Unexpected error calling OpenRouter API: {e}")
 
+    def generate_responses(self, prompts: list[str], model: str | None = None, timeout: int = 30, concurrency: int = 8) -> list[str | None]:
+        """Call generate_response for each prompt, up to concurrency requests at
+            a time, returning results in prompt order. Raises the first ValueError
+            encountered, as generate_response does.
+        """
+        workers = max(1, min(concurrency, len(prompts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda prompt: self.generate_response(prompt, model, timeout), prompts))
+
     def check_api_key(self) -> bool:
         """Verify API key is valid and OpenRouter service is accessible.
 
@@ -269,10 +355,9 @@ def generate_session_filename(card_codes: list[str]) -> str:
     """Create timestamped filename with card codes for session saving.
 
     Format: YYYY-MM-DD-HHMMSS-codes.md"""
-    import re
     timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
     # Sanitize card codes to prevent injection
-    safe_codes = [re.sub(r'[^a-zA-Z0-9]', '', code) for code in card_codes if code]
+    safe_codes = [code.translate(_FILENAME_TABLE) for code in card_codes if code]
     codes_str = "-".join(safe_codes) if safe_codes else "no-codes"
     return f"{timestamp}-{codes_str}.md"
 
@@ -2,17 +2,23 @@
 
 from argparse import ArgumentParser
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
-from pathlib import Path
 from secrets import token_bytes
 from sys import argv, stdin
 from time import time
-from typing import Any, NoReturn, cast
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, NoReturn, cast
 
 from tarot_oracle.config import config
 from tarot_oracle.data_loader import BundledDataLoader
 from tarot_oracle.loaders import SpreadLoader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import ast
 import json
 import os
@@ -143,6 +149,9 @@ _air = 'Psychic Basis/Mutable Influences (Air)'
 _fire = 'Karmic Forces/Cosmic Influences (Fire)'
 _spirit = 'Nature of Circumstances (Spirit)'
 
+_SUIT_NAMES = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'P': 'Pentacles'}
+_CARD_TYPE_NAMES = {'major': 'Major Arcana'}
+
 SEMANTICS = {
     '3-card': [['Past/Querent/Situation/Idea', 'Present/Path/Action/Process', 'Future/Potential/Outcome/Aspiration']],
     'cross': [
@@ -164,8 +173,40 @@ SEMANTICS = {
 }
 
 
+@lru_cache(maxsize=64)
+def _read_deck_config(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse and validate a deck file. The file's mtime and size are part of
+        the cache key, so an edited file is parsed again. The result is a
+        read-only view because it is shared by every caller.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    deck_config = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    # Basic validation
+    if not isinstance(deck_config, dict):
+        raise ValueError(f"Deck configuration must be a JSON object: {path}")
+
+    # Validate required top-level fields
+    if 'name' not in deck_config:
+        raise ValueError(f"Deck configuration must include 'name' field: {path}")
+
+    return MappingProxyType(deck_config)
+
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """String equivalent of Path.is_relative_to for normalized absolute paths."""
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
 class DeckLoader:
-    """Handles loading and management of tarot deck configurations."""
+    """Handles loading and management of tarot deck configurations.
+        Stateless; parsed deck files are cached at module level.
+    """
+    __slots__ = ()
 
     def resolve_deck_path(self, filename: str) -> str | None:
         """Resolve deck filename using search order with security validation from
@@ -173,44 +214,33 @@ class DeckLoader:
             not found or invalid.
         """
         # Sanitize filename to prevent path traversal
-        safe_filename = re.sub(r'[^a-zA-Z0-9._-]', '', filename)
+        safe_filename = _UNSAFE_FILENAME_RE.sub('', filename)
         safe_filename = safe_filename.lstrip('.-')
         if not safe_filename:
             return None
             
-        search_paths = [
-            Path.cwd() / safe_filename,
-            Path.cwd() / f"{safe_filename}.json",
-            config.decks_dir / safe_filename,
-            config.decks_dir / f"{safe_filename}.json"
-        ]
-
-        for path in search_paths:
-            if path.exists() and path.is_file():
-                resolved = path.resolve()
+        cwd = os.getcwd()
+        home_dir = os.fspath(config.home_dir)
+        for directory in (cwd, os.fspath(config.decks_dir)):
+            for candidate in (safe_filename, f"{safe_filename}.json"):
+                path = os.path.join(directory, candidate)
+                if not os.path.isfile(path):
+                    continue
+                resolved = os.path.realpath(path)
                 # Ensure path is within expected directories
-                if (resolved.is_relative_to(Path.cwd()) or 
-                    resolved.is_relative_to(config.home_dir)):
-                    return str(resolved)
+                if _is_within(resolved, cwd) or _is_within(resolved, home_dir):
+                    return resolved
         return None
 
     @staticmethod
-    def load_deck_config(path: str) -> dict:
-        """Load and validate JSON deck configuration."""
+    def load_deck_config(path: str) -> Mapping[str, Any]:
+        """Load and validate JSON deck configuration. Parsed configurations
+            are cached until the file changes and shared between calls, so
+            the top level is returned as a read-only mapping.
+        """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            # Basic validation
-            if not isinstance(config, dict):
-                raise ValueError(f"Deck configuration must be a JSON object: {path}")
-
-            # Validate required top-level fields
-            if 'name' not in config:
-                raise ValueError(f"Deck configuration must include 'name' field: {path}")
-
-            return config
-
+            stat = os.stat(path)
+            return _read_deck_config(path, stat.st_mtime_ns, stat.st_size)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in deck file: {e} (file: {path})")
         except FileNotFoundError:
@@ -232,7 +262,7 @@ class DeckLoader:
         # Find all .json files in the decks directory
         for json_file in decks_dir.glob("*.json"):
             try:
-                config = DeckLoader.load_deck_config(str(json_file))
+                config = DeckLoader.load_deck_config(os.fspath(json_file))
                 decks.append({
                     "filename": json_file.name,
                     "name": config.get("name", "Unnamed Deck"),
@@ -257,12 +287,13 @@ class DeckLoader:
         return Deck(deck_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """Represents a single tarot card with metadata and keywords.
 
     Stores classification (major/minor), suit, value, and interpretation keywords.
-    Supports upright and reversed positions. Reversal state set during reading."""
+    Supports upright and reversed positions. Reversal state set during reading.
+    Slotted, since a deck holds 78 instances and readings copy them."""
     name: str
     card_type: str  # 'major' or 'minor'
     suit: str|None  # W, C, S, P or None for major arcana
@@ -277,6 +308,10 @@ class Card:
             return self.reversed_keywords
         return self.keywords
 
+    def get_type_name(self) -> str:
+        """Get display name of the card's arcana or suit."""
+        return _CARD_TYPE_NAMES.get(self.card_type) or _SUIT_NAMES[self.suit or '']
+
     def get_notation_code(self) -> str:
         """Get raw card notation without formatting."""
         if self.card_type == 'major':
@@ -296,10 +331,12 @@ class Card:
 
 
 class DeterministicRNG:
-    """Simple linear congruential generator for deterministic random numbers."""
+    """Simple linear congruential generator for deterministic random numbers.
+        Accepts an int seed or raw seed bytes (read little-endian).
+    """
 
-    def __init__(self, seed: int) -> None:
-        self.state = seed
+    def __init__(self, seed: int | bytes) -> None:
+        self.state = int.from_bytes(seed, 'little') if isinstance(seed, bytes) else seed
 
     def next_int(self, max_value: int) -> int:
         """Generate next pseudo-random integer."""
@@ -462,18 +499,20 @@ class Deck:
 
     def shuffle_and_assign_reversals(self, rng: DeterministicRNG, allow_reversed: bool = False) -> None:
         """Shuffle the deck using Fisher-Yates algorithm and assign reversals."""
-        self.shuffled = self.cards.copy()
-        n = len(self.shuffled)
+        shuffled = self.cards.copy()
+        next_int = rng.next_int
 
         # Fisher-Yates shuffle
-        for i in range(n - 1, 0, -1):
-            j = rng.next_int(i + 1)
-            self.shuffled[i], self.shuffled[j] = self.shuffled[j], self.shuffled[i]
+        for i in range(len(shuffled) - 1, 0, -1):
+            j = next_int(i + 1)
+            shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
 
         # Assign reversals during shuffle
         if allow_reversed:
-            for card in self.shuffled:
-                card.is_reversed = (rng.next_int(2) == 1)  # 50% chance
+            for card in shuffled:
+                card.is_reversed = (next_int(2) == 1)  # 50% chance
+
+        self.shuffled = shuffled
 
     def shuffle(self, rng: DeterministicRNG) -> None:
         """Shuffle the deck using Fisher-Yates algorithm."""
@@ -552,11 +591,7 @@ class SpreadRenderer:
 
         legend_lines = ["Legend:"]
         for card in cards:
-            if card.card_type == 'major':
-                type_name = "Major Arcana"
-            else:
-                suit_names = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'P': 'Pentacles'}
-                type_name = suit_names[card.suit or '']
+            type_name = card.get_type_name()
 
             legend_line = f"{card.get_notation()} - {card.name} ({type_name})"
             if include_keywords:
@@ -620,11 +655,7 @@ class SpreadRenderer:
 
         legend_data = []
         for card in cards:
-            if card.card_type == 'major':
-                type_name = "Major Arcana"
-            else:
-                suit_names = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'P': 'Pentacles'}
-                type_name = suit_names[card.suit or '']
+            type_name = card.get_type_name()
 
             card_dict = {
                 "notation": card.get_notation(),
@@ -672,6 +703,25 @@ class SpreadRenderer:
         return "\n".join(description_lines)
 
 
+def _resolve_placeholders(text: str, semantic_groups: Iterable[tuple[str, str]]) -> str:
+    """Replace ${name} placeholders in text with their semantic group definitions."""
+    for var_name, definition in semantic_groups:
+        text = text.replace(f"${{{var_name}}}", definition)
+    return text
+
+
+@lru_cache(maxsize=128)
+def _resolve_semantics(semantics: tuple[tuple[str | None, ...], ...],
+                       semantic_groups: tuple[tuple[str, str], ...]) -> tuple[tuple[str | None, ...], ...]:
+    """Resolve placeholders in every string cell of a semantics matrix. Cached
+        because spreads reuse the same static semantics for every reading.
+    """
+    return tuple(
+        tuple(_resolve_placeholders(cell, semantic_groups) if isinstance(cell, str) else cell for cell in row)
+        for row in semantics
+    )
+
+
 class SemanticAdapter:
     """Maps cards to semantic meanings based on spread position."""
 
@@ -688,24 +738,17 @@ class SemanticAdapter:
 
     def resolve_variables(self, text: str) -> str:
         """Replace variable placeholders like ${cap} with semantic_group definitions."""
-        for var_name, definition in self.semantic_groups.items():
-            placeholder = f"${{{var_name}}}"
-            text = text.replace(placeholder, definition)
-        return text
+        return _resolve_placeholders(text, self.semantic_groups.items())
 
     def _process_semantics(self, semantics: list[list[str]]) -> list[list[str]]:
-        """Resolve variable placeholders in semantics."""
-        resolved = []
-        for row in semantics:
-            resolved_row = []
-            for cell in row:
-                if isinstance(cell, str):
-                    resolved_cell = self.resolve_variables(cell)
-                else:
-                    resolved_cell = cell
-                resolved_row.append(resolved_cell)
-            resolved.append(resolved_row)
-        return resolved
+        """Resolve variable placeholders in semantics, reusing the result for
+            any earlier adapter built from the same semantics and groups.
+        """
+        resolved = _resolve_semantics(
+            tuple(tuple(row) for row in semantics),
+            tuple(self.semantic_groups.items()),
+        )
+        return [list(row) for row in resolved]
 
     def _get_semantic_for_position(self, position: int) -> str|None:
         """Find semantic value for a given position in layout."""
@@ -751,11 +794,7 @@ class SemanticAdapter:
 
     def _format_card_line(self, card: Card, include_keywords: bool) -> str:
         """Format individual card line for legend."""
-        if card.card_type == 'major':
-            type_name = "Major Arcana"
-        else:
-            suit_names = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'P': 'Pentacles'}
-            type_name = suit_names[card.suit or '']
+        type_name = card.get_type_name()
 
         legend_line = f"  {card.get_notation()} - {card.name} ({type_name})"
         if include_keywords:
@@ -804,12 +843,12 @@ class SemanticAdapter:
         if not semantic_config or 'guidance' not in semantic_config:
             return []
 
-        guidance = []
-        for guidance_text in semantic_config['guidance']:
-            resolved = self.resolve_variables(guidance_text)
-            if resolved:
-                guidance.append(f"- {resolved}")
-        return guidance
+        # Guidance is static per spread, so resolve it through the same cache as semantics
+        (resolved_row,) = _resolve_semantics(
+            (tuple(semantic_config['guidance']),),
+            tuple(self.semantic_groups.items()),
+        )
+        return [f"- {resolved}" for resolved in resolved_row if resolved]
 
 
 class TarotDivination:
@@ -821,8 +860,10 @@ class TarotDivination:
     def __init__(self, deck_path: str | None = None) -> None:
         self.deck = Deck(deck_path)
 
-    def create_seed(self, timestamp: str, question: str, invocation: str|None = None, random_bytes: int = 0) -> int:
-        """Create seed from timestamp, question, optional invocation, and random bytes."""
+    def create_seed_bytes(self, timestamp: str, question: str, invocation: str|None = None, random_bytes: int = 0) -> bytes:
+        """Create raw sha256 seed digest from timestamp, question, optional
+            invocation, and random bytes.
+        """
         seed_data = f"{timestamp}{question}"
         if invocation:
             seed_data += f"|{invocation}"  # Use | as separator
@@ -830,7 +871,11 @@ class TarotDivination:
             random_suffix = token_bytes(random_bytes).hex()
             seed_data += random_suffix
 
-        return int.from_bytes(sha256(seed_data.encode()).digest(), 'little')
+        return sha256(seed_data.encode()).digest()
+
+    def create_seed(self, timestamp: str, question: str, invocation: str|None = None, random_bytes: int = 0) -> int:
+        """Create integer seed from timestamp, question, optional invocation, and random bytes."""
+        return int.from_bytes(self.create_seed_bytes(timestamp, question, invocation, random_bytes), 'little')
 
     def _normalize_spread_layout(self, spread_layout: list[list[int]] | list[int]) -> tuple[list[list[int]], int]:
         """Normalize spread layout to matrix format and return (layout, card_count)."""
@@ -850,7 +895,7 @@ class TarotDivination:
         needed_cards = len([pos for row in normalized_layout for pos in row if pos > 0])
         return normalized_layout, needed_cards
 
-    def draw_cards_for_reading(self, seed: int, spread_layout: list[list[int]] | list[int], allow_reversed: bool = False) -> list[Card]:
+    def draw_cards_for_reading(self, seed: int | bytes, spread_layout: list[list[int]] | list[int], allow_reversed: bool = False) -> list[Card]:
         """Draw cards for reading using explicit seed - pure deterministic function."""
         rng = DeterministicRNG(seed)
         self.deck.shuffle_and_assign_reversals(rng, allow_reversed)
@@ -863,7 +908,7 @@ class TarotDivination:
         """Perform tarot reading and return JSON-serializable data."""
         # Create seed and draw cards (reuse existing logic)
         timestamp = str(int(time()))
-        seed = self.create_seed(timestamp, question, invocation, random_bytes)
+        seed = self.create_seed_bytes(timestamp, question, invocation, random_bytes)
         drawn_cards = self.draw_cards_for_reading(seed, spread_layout, allow_reversed)
 
         # Generate JSON structure
@@ -874,7 +919,7 @@ class TarotDivination:
             "question": question,
             "spread_type": str(spread_layout),
             "timestamp": timestamp,
-            "seed": seed,
+            "seed": seed.hex(),
             "allow_reversed": allow_reversed,
             "invocation": invocation
         })
@@ -891,7 +936,7 @@ class TarotDivination:
 
         # Create seed
         timestamp = str(int(time()))
-        seed = self.create_seed(timestamp, question, invocation, random_bytes)
+        seed = self.create_seed_bytes(timestamp, question, invocation, random_bytes)
 
         # Draw cards
         drawn_cards = self.draw_cards_for_reading(seed, layout, allow_reversed)
@@ -954,6 +999,9 @@ def resolve_spread(spread_input: str) -> tuple[list[list[int]], dict[str, Any]|N
         raise ValueError(f"Invalid spread '{spread_input}'. Use aliases: {list(SPREADS.keys())}, custom spread name, or custom matrix.")
 
 
+_NOTATION_RE = re.compile(r'\[([↓ ])(.*)\]', re.DOTALL)
+
+
 def resolve_card_codes(codes: str) -> list[Card]:
     """Resolve CSV card codes to Card objects."""
     if not codes:
@@ -973,13 +1021,12 @@ def resolve_card_codes(codes: str) -> list[Card]:
 
     resolved_cards = []
     for code in code_list:
-        # Handle reversal notation like [↓XVI]
+        # Handle reversal notation like [↓XVI] or [ XVI ]
         is_reversed = False
-        if code.startswith('[↓') and code.endswith(']'):
-            is_reversed = True
-            code = code[2:-1].strip()  # Remove [↓ and ]
-        elif code.startswith('[ ') and code.endswith(']'):
-            code = code[2:-1].strip()  # Remove [ and ]
+        match = _NOTATION_RE.fullmatch(code)
+        if match:
+            is_reversed = match.group(1) == '↓'
+            code = match.group(2).strip()
 
         # Clean up common notation issues
         # Convert underscore notation (C_Q) to direct notation (CQ)
@@ -1,14 +1,15 @@
 """Test CLI subcommand functionality and unified interface."""
 
-import unittest
-import sys
-from unittest.mock import patch, Mock
-from io import StringIO
+from __future__ import annotations
+
 from argparse import ArgumentParser
-from pathlib import Path
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import unittest
 
+from tarot_oracle import cli
 from tarot_oracle.cli import (
     create_unified_parser,
     main as cli_main,
@@ -20,32 +21,79 @@ from tarot_oracle.cli import (
 # Custom exceptions removed - using standard TypeError and ValueError instead
 
 
+def _record_call(result: int | BaseException = 0):
+    """Return a fake entry point that records each argv it is called with
+        and returns result, or raises it if it is an exception.
+    """
+    calls = []
+
+    def fake(args=None):
+        calls.append(args)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    fake.calls = calls
+    return fake
+
+
+class _Grab:
+    """Minimal stderr stand-in that only accumulates written text."""
+    __slots__ = ('s',)
+
+    def __init__(self) -> None:
+        self.s = ''
+
+    def write(self, text: str) -> int:
+        self.s += text
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
 class TestUnifiedParser(unittest.TestCase):
     """Test unified CLI argument parser."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_unified_parser()
+
     def test_parser_creation(self):
         """Test basic parser creation."""
         parser = create_unified_parser()
         assert isinstance(parser, ArgumentParser), "Should return ArgumentParser instance"
         assert parser.prog == "tarot-oracle", f"Expected prog 'tarot-oracle', got '{parser.prog}'"
 
+    def test_parser_is_cached(self):
+        """Test repeated parser creation returns the cached instance."""
+        assert create_unified_parser() is create_unified_parser(), "Full parser should be cached"
+        assert create_unified_parser(['deck', '--list']) is create_unified_parser(['deck', 'question']), "Parser should be cached per subcommand"
+
     def test_version_argument(self):
         """Test version argument handling."""
-        parser = create_unified_parser()
         with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['--version'])
+            with redirect_stdout(StringIO()) as stdout:
+                self.parser.parse_args(['--version'])
+
+        assert stdout.getvalue().strip() == "tarot-oracle 0.1.0", f"Unexpected version output: {stdout.getvalue()!r}"
+
+    def test_main_version_fast_path(self):
+        """Test main prints the version for a bare --version and returns 0."""
+        with redirect_stdout(StringIO()) as stdout:
+            result = cli_main(['--version'])
+
+        assert result == 0, f"Expected return code 0, got {result}"
+        assert stdout.getvalue().strip() == "tarot-oracle 0.1.0", f"Unexpected version output: {stdout.getvalue()!r}"
 
     def test_subcommands_required(self):
         """Test that subcommands are required."""
-        parser = create_unified_parser()
         with self.assertRaises(SystemExit):
-            parser.parse_args([])
+            self.parser.parse_args([])
 
     def test_reading_command_parsing(self):
         """Test reading subcommand parsing."""
-        parser = create_unified_parser()
-        args = parser.parse_args([
+        args = self.parser.parse_args([
             'reading',
             'What does the future hold?',
             '--provider', 'gemini',
@@ -59,43 +107,31 @@ class TestUnifiedParser(unittest.TestCase):
         assert args.interpret is True, f"Expected interpret=True, got {args.interpret}"
         assert args.spread == 'celtic', f"Expected spread 'celtic', got '{args.spread}'"
 
-    def test_deck_command_parsing(self):
-        """Test deck subcommand parsing."""
-        parser = create_unified_parser()
-        args = parser.parse_args([
-            'deck',
-            '--list'
-        ])
-
-        assert args.command == 'deck', f"Expected command 'deck', got '{args.command}'"
-        assert args.list_decks is True, f"Expected list_decks=True, got {args.list_decks}"
-
-    def test_invocation_command_parsing(self):
-        """Test invocation subcommand parsing."""
-        parser = create_unified_parser()
-        args = parser.parse_args([
-            'invocation',
-            '--list'
-        ])
-
-        assert args.command == 'invocation', f"Expected command 'invocation', got '{args.command}'"
-        assert args.list_invocations is True, f"Expected list_invocations=True, got {args.list_invocations}"
+    def test_list_command_parsing(self):
+        """Test deck, invocation, and spread subcommand --list parsing."""
+        for command, dest in [('deck', 'list_decks'), ('invocation', 'list_invocations'), ('spread', 'list_spreads')]:
+            with self.subTest(command=command):
+                args = self.parser.parse_args([command, '--list'])
 
-    def test_spread_command_parsing(self):
-        """Test spread subcommand parsing."""
-        parser = create_unified_parser()
-        args = parser.parse_args([
-            'spread',
-            '--list'
-        ])
+                assert args.command == command, f"Expected command '{command}', got '{args.command}'"
+                assert getattr(args, dest) is True, f"Expected {dest}=True, got {getattr(args, dest)}"
 
-        assert args.command == 'spread', f"Expected command 'spread', got '{args.command}'"
+    def test_parser_built_for_sniffed_subcommand(self):
+        """Test parser built from argv only registers the named subcommand."""
+        parser = create_unified_parser(['spread', '--list'])
+        args = parser.parse_args(['spread', '--list'])
         assert args.list_spreads is True, f"Expected list_spreads=True, got {args.list_spreads}"
 
+        parser = create_unified_parser(['--help'])
+        with self.assertRaises(SystemExit):
+            with redirect_stdout(StringIO()) as stdout:
+                parser.parse_args(['--help'])
+        for command in ['reading', 'deck', 'invocation', 'spread']:
+            assert command in stdout.getvalue(), f"Help should mention {command} command"
+
     def test_reading_command_defaults(self):
         """Test reading command defaults."""
-        parser = create_unified_parser()
-        args = parser.parse_args([
+        args = self.parser.parse_args([
             'reading',
             'Test question'
         ])
@@ -106,21 +142,20 @@ class TestUnifiedParser(unittest.TestCase):
 
     def test_provider_choices_validation(self):
         """Test provider choice validation."""
-        parser = create_unified_parser()
         with self.assertRaises(SystemExit):
-            parser.parse_args([
+            self.parser.parse_args([
                 'reading',
                 'Test question',
                 '--provider', 'invalid'
             ])
 
 
-class TestReadingArguments(unittest.TestCase):
-    """Test reading subcommand argument configuration."""
+class TestSubcommandArguments(unittest.TestCase):
+    """Test subcommand argument configuration helpers."""
 
     def test_add_reading_arguments(self):
         """Test reading arguments are added correctly."""
-        parser = ArgumentParser()
+        parser = ArgumentParser(add_help=False)
         _add_reading_arguments(parser)
 
         # Test parsing with all arguments
@@ -140,321 +175,298 @@ class TestReadingArguments(unittest.TestCase):
         assert args.invocation_name == 'custom', f"Expected invocation_name 'custom', got '{args.invocation_name}'"
         assert args.spread == 'celtic', f"Expected spread 'celtic', got '{args.spread}'"
 
+    def test_add_list_arguments(self):
+        """Test deck, invocation, and spread --list arguments are added correctly."""
+        cases = [
+            (_add_deck_arguments, 'list_decks'),
+            (_add_invocation_arguments, 'list_invocations'),
+            (_add_spread_arguments, 'list_spreads'),
+        ]
+        for add_arguments, dest in cases:
+            with self.subTest(dest=dest):
+                parser = ArgumentParser(add_help=False)
+                add_arguments(parser)
 
-class TestDeckArguments(unittest.TestCase):
-    """Test deck subcommand argument configuration."""
-
-    def test_add_deck_arguments(self):
-        """Test deck arguments are added correctly."""
-        parser = ArgumentParser()
-        _add_deck_arguments(parser)
-
-        # Test parsing with list argument
-        args = parser.parse_args(['--list'])
-        assert args.list_decks is True, f"Expected list_decks=True, got {args.list_decks}"
-
-
-class TestInvocationArguments(unittest.TestCase):
-    """Test invocation subcommand argument configuration."""
-
-    def test_add_invocation_arguments(self):
-        """Test invocation arguments are added correctly."""
-        parser = ArgumentParser()
-        _add_invocation_arguments(parser)
-
-        # Test parsing with list argument
-        args = parser.parse_args(['--list'])
-        assert args.list_invocations is True, f"Expected list_invocations=True, got {args.list_invocations}"
+                # Test parsing with list argument
+                args = parser.parse_args(['--list'])
+                assert getattr(args, dest) is True, f"Expected {dest}=True, got {getattr(args, dest)}"
 
 
-class TestSpreadArguments(unittest.TestCase):
-    """Test spread subcommand argument configuration."""
+class _BackendSwapTestCase(unittest.TestCase):
+    """Restore the CLI's backend entry points after each test so tests can
+        assign fakes to them directly.
+    """
 
-    def test_add_spread_arguments(self):
-        """Test spread arguments are added correctly."""
-        parser = ArgumentParser()
-        _add_spread_arguments(parser)
+    def setUp(self):
+        self._oracle_main = cli.oracle_main
+        self._tarot_main = cli.tarot_main
 
-        # Test parsing with list argument
-        args = parser.parse_args(['--list'])
-        assert args.list_spreads is True, f"Expected list_spreads=True, got {args.list_spreads}"
+    def tearDown(self):
+        cli.oracle_main = self._oracle_main
+        cli.tarot_main = self._tarot_main
 
 
-class TestCLIIntegration(unittest.TestCase):
+class TestCLIIntegration(_BackendSwapTestCase):
     """Test CLI integration with backend modules."""
 
-    @patch('tarot_oracle.cli.oracle_main')
-    def test_reading_command_integration(self, mock_oracle_main):
+    def test_reading_command_integration(self):
         """Test reading command integration with oracle module."""
-        mock_oracle_main.return_value = 0
+        fake_oracle_main = _record_call(0)
 
         test_args = [
-            'tarot-oracle',
             'reading',
             'What does the future hold?',
             '--provider', 'gemini',
             '--interpret'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        cli.oracle_main = fake_oracle_main
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
-        mock_oracle_main.assert_called_once()
+        assert len(fake_oracle_main.calls) == 1, f"Expected one call, got {len(fake_oracle_main.calls)}"
 
-    @patch('tarot_oracle.cli.tarot_main')
-    def test_deck_command_integration(self, mock_tarot_main):
+    def test_deck_command_integration(self):
         """Test deck command integration with tarot module."""
-        mock_tarot_main.return_value = 0
+        fake_tarot_main = _record_call(0)
 
         test_args = [
-            'tarot-oracle',
             'deck',
             '--list'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        cli.tarot_main = fake_tarot_main
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
-        mock_tarot_main.assert_called_once()
+        assert len(fake_tarot_main.calls) == 1, f"Expected one call, got {len(fake_tarot_main.calls)}"
 
     def test_invocation_command_integration(self):
         """Test invocation command integration."""
         test_args = [
-            'tarot-oracle',
             'invocation',
             '--list'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        result = cli_main(test_args)
+
+        assert result == 0, f"Expected return code 0, got {result}"
+
+    def test_invocation_list_shows_preview(self):
+        """Test invocation --list prints each invocation's preview."""
+        invocations = [{"filename": "test.txt", "name": "test", "preview": "Hear me"}]
+        with patch('tarot_oracle.loaders.InvocationLoader.list_invocations', lambda self: invocations):
+            with redirect_stdout(StringIO()) as stdout:
+                result = cli_main(['invocation', '--list'])
 
         assert result == 0, f"Expected return code 0, got {result}"
+        assert "Hear me" in stdout.getvalue(), "Invocation preview should be listed"
 
     def test_spread_command_integration(self):
         """Test spread command integration."""
         test_args = [
-            'tarot-oracle',
             'spread',
             '--list'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
 
 
-class TestCLIErrorHandling(unittest.TestCase):
+class TestCLIErrorHandling(_BackendSwapTestCase):
     """Test CLI error handling and user guidance."""
 
-    @patch('tarot_oracle.cli.oracle_main')
-    def test_tarot_oracle_error_handling(self, mock_oracle_main):
+    def test_tarot_oracle_error_handling(self):
         """Test handling of ValueError."""
-        mock_oracle_main.side_effect = ValueError(
-            "Test error"
-        )
+        fake_oracle_main = _record_call(ValueError("Test error"))
 
         test_args = [
-            'tarot-oracle',
             'reading',
             'Test question'
         ]
 
-        with patch('sys.argv', test_args):
-            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-                result = cli_main()
+        cli.oracle_main = fake_oracle_main
+        with redirect_stderr(_Grab()) as stderr:
+            result = cli_main(test_args)
 
         assert result != 0, f"Expected non-zero return code for error, got {result}"
-        assert "Test error" in mock_stderr.getvalue(), "Error message should be in stderr"
+        assert "Test error" in stderr.s, "Error message should be in stderr"
 
 
-    @patch('tarot_oracle.cli.oracle_main')
-    def test_generic_error_handling(self, mock_oracle_main):
+    def test_generic_error_handling(self):
         """Test handling of generic exceptions."""
-        mock_oracle_main.side_effect = Exception("Unexpected error")
+        fake_oracle_main = _record_call(Exception("Unexpected error"))
 
         test_args = [
-            'tarot-oracle',
             'reading',
             'Test question'
         ]
 
-        with patch('sys.argv', test_args):
-            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-                result = cli_main()
+        cli.oracle_main = fake_oracle_main
+        with redirect_stderr(_Grab()) as stderr:
+            result = cli_main(test_args)
 
         assert result != 0, f"Expected non-zero return code for error, got {result}"
-        assert "Unexpected error" in mock_stderr.getvalue(), "Error message should be in stderr"
+        assert "Unexpected error" in stderr.s, "Error message should be in stderr"
 
 
 class TestCLIHelpSystem(unittest.TestCase):
     """Test CLI help system and documentation."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_unified_parser()
+        cls._buffer = StringIO()
+        cls.help_texts = {
+            command: cls._capture_help(['--help'] if command is None else [command, '--help'])
+            for command in [None, 'reading', 'deck', 'invocation', 'spread']
+        }
+
+    @classmethod
+    def _capture_help(cls, argv):
+        """Return the help text printed for argv, reusing one buffer."""
+        cls._buffer.seek(0)
+        cls._buffer.truncate(0)
+        with redirect_stdout(cls._buffer):
+            try:
+                cls.parser.parse_args(argv)
+            except SystemExit:
+                pass
+        return cls._buffer.getvalue()
+
     def test_main_help(self):
         """Test main help output."""
-        parser = create_unified_parser()
-        with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['--help'])
-
-        help_text = mock_stdout.getvalue()
-        assert "Unified CLI for Tarot Oracle" in help_text, "Help should contain CLI description"
-        assert "reading" in help_text, "Help should mention reading command"
-        assert "deck" in help_text, "Help should mention deck command"
-        assert "invocation" in help_text, "Help should mention invocation command"
-        assert "spread" in help_text, "Help should mention spread command"
+        help_text = self.help_texts[None]
+        required = ["Unified CLI for Tarot Oracle", "reading", "deck", "invocation", "spread"]
+        missing = [term for term in required if term not in help_text]
+        assert not missing, f"Help is missing: {missing}"
 
     def test_reading_help(self):
         """Test reading subcommand help."""
-        parser = create_unified_parser()
-        with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['reading', '--help'])
-
-        help_text = mock_stdout.getvalue()
+        help_text = self.help_texts['reading']
         assert "oracle functionality" in help_text.lower(), "Help should mention oracle functionality"
         assert "provider" in help_text, "Help should mention provider option"
         assert "interpret" in help_text, "Help should mention interpret option"
 
     def test_deck_help(self):
         """Test deck subcommand help."""
-        parser = create_unified_parser()
-        with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['deck', '--help'])
-
-        help_text = mock_stdout.getvalue()
-        assert "tarot decks" in help_text.lower(), "Help should mention tarot decks"
-        assert "list" in help_text.lower(), "Help should mention list option"
+        help_text = self.help_texts['deck'].lower()
+        assert "tarot decks" in help_text, "Help should mention tarot decks"
+        assert "list" in help_text, "Help should mention list option"
 
     def test_invocation_help(self):
         """Test invocation subcommand help."""
-        parser = create_unified_parser()
-        with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['invocation', '--help'])
-
-        help_text = mock_stdout.getvalue()
-        assert "invocation" in help_text.lower(), "Help should mention invocation"
-        assert "custom" in help_text.lower(), "Help should mention custom invocations"
+        help_text = self.help_texts['invocation'].lower()
+        assert "invocation" in help_text, "Help should mention invocation"
+        assert "custom" in help_text, "Help should mention custom invocations"
 
     def test_spread_help(self):
         """Test spread subcommand help."""
-        parser = create_unified_parser()
-        with self.assertRaises(SystemExit):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                parser.parse_args(['spread', '--help'])
+        help_text = self.help_texts['spread'].lower()
+        assert "spread" in help_text, "Help should mention spread"
+        assert "custom" in help_text, "Help should mention custom spreads"
 
-        help_text = mock_stdout.getvalue()
-        assert "spread" in help_text.lower(), "Help should mention spread"
-        assert "custom" in help_text.lower(), "Help should mention custom spreads"
+    def test_help_exits(self):
+        """Test that --help exits after printing."""
+        with self.assertRaises(SystemExit):
+            with redirect_stdout(StringIO()):
+                self.parser.parse_args(['--help'])
 
 
 class TestCLIArguments(unittest.TestCase):
     """Test CLI argument validation and processing."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_unified_parser()
+
     def test_question_argument_required(self):
         """Test that question is required for reading command."""
-        parser = create_unified_parser()
         with self.assertRaises(SystemExit):
-            parser.parse_args(['reading'])
+            self.parser.parse_args(['reading'])
 
     def test_provider_argument_choices(self):
         """Test provider argument limited to valid choices."""
-        parser = create_unified_parser()
-
         # Valid providers should work
         for provider in ['gemini', 'openrouter', 'ollama']:
-            args = parser.parse_args([
-                'reading', 'Test question', '--provider', provider
-            ])
-            assert args.provider == provider, f"Expected provider {provider}, got {args.provider}"
+            with self.subTest(provider=provider):
+                args = self.parser.parse_args([
+                    'reading', 'Test question', '--provider', provider
+                ])
+                assert args.provider == provider, f"Expected provider {provider}, got {args.provider}"
 
     def test_spread_argument_processing(self):
         """Test spread argument processing."""
-        parser = create_unified_parser()
-
         # Default spread
-        args = parser.parse_args(['reading', 'Test question'])
+        args = self.parser.parse_args(['reading', 'Test question'])
         assert args.spread == '3-card', f"Expected default spread '3-card', got '{args.spread}'"
 
         # Custom spread
-        args = parser.parse_args([
+        args = self.parser.parse_args([
             'reading', 'Test question', '--spread', 'celtic'
         ])
         assert args.spread == 'celtic', f"Expected custom spread 'celtic', got '{args.spread}'"
 
     def test_boolean_flags(self):
         """Test boolean flag processing."""
-        parser = create_unified_parser()
-
-        # Default (False)
-        args = parser.parse_args(['reading', 'Test question'])
-        assert args.interpret is False, f"Expected default interpret=False, got {args.interpret}"
-
-        # Explicit True
-        args = parser.parse_args(['reading', 'Test question', '--interpret'])
-        assert args.interpret is True, f"Expected interpret=True when flag set, got {args.interpret}"
+        # Default (False) and explicit True
+        for extra, expected in [([], False), (['--interpret'], True)]:
+            with self.subTest(extra=extra):
+                args = self.parser.parse_args(['reading', 'Test question', *extra])
+                assert args.interpret is expected, f"Expected interpret={expected}, got {args.interpret}"
 
 
-class TestCLIExamples(unittest.TestCase):
+class TestCLIExamples(_BackendSwapTestCase):
     """Test CLI usage examples from documentation."""
 
-    @patch('tarot_oracle.cli.oracle_main')
-    def test_example_interpretation_reading(self, mock_oracle_main):
+    def test_example_interpretation_reading(self):
         """Test example: tarot-oracle reading "What does the future hold?" --interpret --provider gemini."""
-        mock_oracle_main.return_value = 0
+        fake_oracle_main = _record_call(0)
 
         test_args = [
-            'tarot-oracle',
             'reading',
             'What does the future hold?',
             '--interpret',
             '--provider', 'gemini'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        cli.oracle_main = fake_oracle_main
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
-        mock_oracle_main.assert_called_once()
+        assert len(fake_oracle_main.calls) == 1, f"Expected one call, got {len(fake_oracle_main.calls)}"
 
-    @patch('tarot_oracle.cli.tarot_main')
-    def test_example_list_decks(self, mock_tarot_main):
+    def test_example_list_decks(self):
         """Test example: tarot-oracle deck --list."""
-        mock_tarot_main.return_value = 0
+        fake_tarot_main = _record_call(0)
 
         test_args = [
-            'tarot-oracle',
             'deck',
             '--list'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        cli.tarot_main = fake_tarot_main
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
-        mock_tarot_main.assert_called_once()
+        assert len(fake_tarot_main.calls) == 1, f"Expected one call, got {len(fake_tarot_main.calls)}"
 
-    @patch('tarot_oracle.cli.oracle_main')
-    def test_example_custom_invocation(self, mock_oracle_main):
+    def test_example_custom_invocation(self):
         """Test example: tarot-oracle reading "Should I take this opportunity?" --invocation-name hermes-thoth."""
-        mock_oracle_main.return_value = 0
+        fake_oracle_main = _record_call(0)
 
         test_args = [
-            'tarot-oracle',
             'reading',
             'Should I take this opportunity?',
             '--invocation-name', 'hermes-thoth'
         ]
 
-        with patch('sys.argv', test_args):
-            result = cli_main()
+        cli.oracle_main = fake_oracle_main
+        result = cli_main(test_args)
 
         assert result == 0, f"Expected return code 0, got {result}"
-        mock_oracle_main.assert_called_once()
+        assert len(fake_oracle_main.calls) == 1, f"Expected one call, got {len(fake_oracle_main.calls)}"
 
 
 if __name__ == "__main__":
@@ -1,21 +1,47 @@
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
 
+import copy
 import json
 import os
-import sys
 import tempfile
 import unittest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from tarot_oracle.config import Config
 
 
+@contextmanager
+def _env(**overrides: str):
+    """Temporarily set environment variables, restoring previous values."""
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
 class TestConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        with _env(HOME=cls._temp_dir.name):
+            cls._base_config = Config()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp_dir.cleanup()
+
+    def setUp(self):
+        self.config = copy.deepcopy(self._base_config)
+
     def test_config_initialization(self):
         """Test that Config initializes with proper defaults."""
-        config = Config()
+        config = self.config
 
         assert config.provider == "gemini", f"Expected 'gemini', got {config.provider}"
         assert config.ollama_host == "localhost:11434", f"Expected 'localhost:11434', got {config.ollama_host}"
@@ -25,20 +51,19 @@ class TestConfig(unittest.TestCase):
 
     def test_config_directory_structure(self):
         """Test that required directories are created."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.dict(os.environ, {'HOME': temp_dir}):
-                config = Config()
+        config = self.config
 
-                # Check that directories were created
-                assert config.home_dir.exists(), "Home directory should exist"
-                assert config.decks_dir.exists(), "Decks directory should exist"
-                assert config.invocations_dir.exists(), "Invocations directory should exist"
-                assert config.spreads_dir.exists(), "Spreads directory should exist"
+        # Check that directories were created under the temporary home
+        assert config.home_dir == Path(self._temp_dir.name) / ".tarot-oracle", f"Unexpected home directory {config.home_dir}"
+        assert config.home_dir.exists(), "Home directory should exist"
+        assert config.decks_dir.exists(), "Decks directory should exist"
+        assert config.invocations_dir.exists(), "Invocations directory should exist"
+        assert config.spreads_dir.exists(), "Spreads directory should exist"
 
     def test_config_file_loading(self):
         """Test that config.json file is loaded properly."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.dict(os.environ, {'HOME': temp_dir}):
+            with _env(HOME=temp_dir):
                 # Create config file
                 config_dir = Path(temp_dir) / ".tarot-oracle"
                 config_dir.mkdir()
@@ -62,20 +87,31 @@ class TestConfig(unittest.TestCase):
     def test_environment_variable_override(self):
         """Test that environment variables override config file."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.dict(os.environ, {
-                'HOME': temp_dir,
-                'ORACLE_PROVIDER': 'openrouter',
-                'OLLAMA_HOST': 'env-host:11434'
-            }):
+            with _env(HOME=temp_dir, ORACLE_PROVIDER='openrouter', OLLAMA_HOST='env-host:11434'):
                 config = Config()
 
                 assert config.provider == "openrouter", f"Expected 'openrouter', got {config.provider}"
                 assert config.ollama_host == "env-host:11434", f"Expected 'env-host:11434', got {config.ollama_host}"
 
+    def test_config_serialize(self):
+        """Test that save writes the full configuration as JSON, including set values."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with _env(HOME=temp_dir):
+                config = Config()
+                config.set('test_key', 'test_value')
+                config.save()
+
+                with open(config.config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+        assert data['test_key'] == 'test_value', f"Expected 'test_value', got {data.get('test_key')}"
+        assert data['provider'] == config.provider, "Saved data should include defaults"
+        assert data == config.config, "Saved data should match the in-memory configuration"
+
     def test_config_save(self):
         """Test that configuration can be saved."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.dict(os.environ, {'HOME': temp_dir}):
+            with _env(HOME=temp_dir):
                 config = Config()
                 config.set('test_key', 'test_value')
                 config.save()
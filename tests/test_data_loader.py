@@ -1,19 +1,37 @@
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
-import json
-import sys
 import unittest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from tarot_oracle.data_loader import BundledDataLoader, _dumps_indented
+
+
+def _raise_not_found(*args, **kwargs):
+    raise FileNotFoundError()
 
-from tarot_oracle.data_loader import BundledDataLoader
+
+def _missing_files(*args, **kwargs):
+    """Stand-in for importlib.resources.files whose resources never exist."""
+    return SimpleNamespace(joinpath=lambda *_: SimpleNamespace(open=_raise_not_found))
 
 
 class TestBundledDataLoader(unittest.TestCase):
+    expected_spreads = frozenset(["cross", "celtic", "single", "zodiac", "crowley", "3-card", "zodiac_plus"])
+
+    @classmethod
+    def setUpClass(cls):
+        cls.spreads = {name: BundledDataLoader.load_spread(name) for name in cls.expected_spreads}
+        cls.deck = BundledDataLoader.load_deck("rider-waite")
+        cls.deck_json = BundledDataLoader.export_deck("rider-waite")
+
     def test_load_deck_existing(self):
         """Test loading existing bundled deck."""
-        deck = BundledDataLoader.load_deck("rider-waite")
+        deck = self.deck
         assert deck is not None, "Should load rider-waite deck"
         assert "name" in deck, "Deck should have 'name' field"
         assert "description" in deck, "Deck should have 'description' field"
@@ -21,7 +39,7 @@ class TestBundledDataLoader(unittest.TestCase):
 
     def test_load_spread_existing(self):
         """Test loading existing bundled spread."""
-        spread = BundledDataLoader.load_spread("celtic")
+        spread = self.spreads["celtic"]
         assert spread is not None, "Should load celtic spread"
         assert "name" in spread, "Spread should have 'name' field"
         assert "description" in spread, "Spread should have 'description' field"
@@ -29,26 +47,32 @@ class TestBundledDataLoader(unittest.TestCase):
 
     def test_load_all_bundled_spreads(self):
         """Test loading all bundled spreads are valid."""
-        expected_spreads = ["cross", "celtic", "single", "zodiac", "crowley", "3-card", "zodiac_plus"]
-        for spread_name in expected_spreads:
-            spread = BundledDataLoader.load_spread(spread_name)
+        for spread_name, spread in self.spreads.items():
             assert spread is not None, f"Should load {spread_name} spread"
             assert "name" in spread, f"{spread_name} should have 'name' field"
             assert "layout" in spread, f"{spread_name} should have 'layout' field"
 
     def test_load_spread_with_semantics(self):
         """Test loading spread with semantic configuration."""
-        spread = BundledDataLoader.load_spread("celtic")
+        spread = self.spreads["celtic"]
         assert spread is not None, "Should load celtic spread"
         assert "semantics" in spread, "Spread should have 'semantics' field"
         assert isinstance(spread["semantics"], list), "Semantics should be a list"
 
     def test_load_simple_spread(self):
         """Test loading minimal spread configuration."""
-        spread = BundledDataLoader.load_spread("single")
+        spread = self.spreads["single"]
         assert spread is not None, "Should load single spread"
         assert spread["layout"] == [[1]], "Single spread should have [[1]] layout"
 
+    def test_loaded_data_is_independent_copy(self):
+        """Verify mutating a loaded spread does not affect later loads."""
+        spread = BundledDataLoader.load_spread("single")
+        assert spread is not None, "Should load single spread"
+        spread["layout"].append([2])
+        fresh = BundledDataLoader.load_spread("single")
+        assert fresh is not None and fresh["layout"] == [[1]], "Cached data should not be mutated"
+
     def test_list_decks(self):
         """Test listing all bundled decks."""
         decks = BundledDataLoader.list_decks()
@@ -59,8 +83,8 @@ class TestBundledDataLoader(unittest.TestCase):
         """Test listing all bundled spreads."""
         spreads = BundledDataLoader.list_spreads()
         assert isinstance(spreads, list), "Should return a list"
-        expected_count = 7
-        assert len(spreads) == expected_count, f"Should have {expected_count} spreads"
+        assert len(spreads) == len(self.expected_spreads), f"Should have {len(self.expected_spreads)} spreads"
+        assert set(spreads) == self.expected_spreads, f"Unexpected spreads: {set(spreads) ^ self.expected_spreads}"
 
     def test_list_no_json_extension(self):
         """Verify listed names don't include .json extension."""
@@ -70,51 +94,32 @@ class TestBundledDataLoader(unittest.TestCase):
 
     def test_export_deck(self):
         """Test exporting deck as JSON string."""
-        deck_json = BundledDataLoader.export_deck("rider-waite")
+        deck_json = self.deck_json
         assert deck_json is not None, "Should export rider-waite deck"
-        parsed = json.loads(deck_json)
-        assert "name" in parsed, "Exported JSON should have 'name' field"
-        assert parsed["name"] == "Rider-Waite", "Deck name should be Rider-Waite"
+        assert '"name": "Rider-Waite"' in deck_json, "Deck name should be Rider-Waite"
 
     def test_export_spread(self):
         """Test exporting spread as JSON string."""
         spread_json = BundledDataLoader.export_spread("celtic")
         assert spread_json is not None, "Should export celtic spread"
-        parsed = json.loads(spread_json)
-        assert "name" in parsed, "Exported JSON should have 'name' field"
-        assert parsed["name"] == "celtic", "Spread name should be celtic"
-
-    @patch('importlib.resources.files')
-    def test_load_deck_nonexistent(self, mock_files):
-        """Test loading non-existent deck returns None."""
-        mock_files.return_value.joinpath.return_value.open.side_effect = FileNotFoundError()
-        deck = BundledDataLoader.load_deck("nonexistent-deck")
-        assert deck is None, "Should return None for non-existent deck"
-
-    @patch('importlib.resources.files')
-    def test_load_spread_nonexistent(self, mock_files):
-        """Test loading non-existent spread returns None."""
-        mock_files.return_value.joinpath.return_value.open.side_effect = FileNotFoundError()
-        spread = BundledDataLoader.load_spread("nonexistent-spread")
-        assert spread is None, "Should return None for non-existent spread"
-
-    @patch('importlib.resources.files')
-    def test_export_deck_nonexistent(self, mock_files):
-        """Test exporting non-existent deck returns None."""
-        mock_files.return_value.joinpath.return_value.open.side_effect = FileNotFoundError()
-        deck_json = BundledDataLoader.export_deck("nonexistent-deck")
-        assert deck_json is None, "Should return None for non-existent deck"
-
-    @patch('importlib.resources.files')
-    def test_export_spread_nonexistent(self, mock_files):
-        """Test exporting non-existent spread returns None."""
-        mock_files.return_value.joinpath.return_value.open.side_effect = FileNotFoundError()
-        spread_json = BundledDataLoader.export_spread("nonexistent-spread")
-        assert spread_json is None, "Should return None for non-existent spread"
+        assert '"name": "celtic"' in spread_json, "Spread name should be celtic"
+
+    @patch('importlib.resources.files', _missing_files)
+    def test_nonexistent_returns_none(self):
+        """Test loading or exporting a non-existent deck or spread returns None."""
+        for loader in (
+            BundledDataLoader.load_deck,
+            BundledDataLoader.load_spread,
+            BundledDataLoader.export_deck,
+            BundledDataLoader.export_spread,
+        ):
+            with self.subTest(loader=loader.__name__):
+                result = loader("nonexistent")
+                assert result is None, f"{loader.__name__} should return None for non-existent data"
 
     def test_deck_structure_valid(self):
         """Validate deck data structure is correct."""
-        deck = BundledDataLoader.load_deck("rider-waite")
+        deck = self.deck
         assert deck is not None, "Should load rider-waite deck"
         assert "cards" in deck, "Deck should have cards"
         cards = deck["cards"]
@@ -136,11 +141,23 @@ class TestBundledDataLoader(unittest.TestCase):
 
     def test_export_format_indented(self):
         """Verify exported JSON is properly indented."""
-        deck_json = BundledDataLoader.export_deck("rider-waite")
+        deck_json = self.deck_json
         assert deck_json is not None, "Should export deck"
-        assert "  " in deck_json, "JSON should be indented with 2 spaces"
-        parsed = json.loads(deck_json)
+        assert deck_json.startswith("{\n  \""), "JSON should be indented with 2 spaces"
+        parsed = _loads(deck_json)
         assert isinstance(parsed, dict), "Exported data should parse as dict"
+        assert parsed == self.deck, "Exported JSON should round-trip to the loaded deck"
+
+    def test_export_non_ascii_matches_with_and_without_orjson(self):
+        """Verify non-ASCII text is written verbatim whether or not orjson is installed."""
+        data = {"name": "Étoile ✶", "cards": ["Lune", "Soleil"]}
+        exported = _dumps_indented(data)
+        with patch("tarot_oracle.data_loader.orjson", None):
+            stdlib_exported = _dumps_indented(data)
+
+        assert "Étoile ✶" in stdlib_exported, "Non-ASCII text should not be escaped"
+        assert stdlib_exported == exported, "Output should not depend on whether orjson is installed"
+        assert _loads(stdlib_exported) == data, "Exported JSON should round-trip"
 
 
 if __name__ == "__main__":
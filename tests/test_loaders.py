@@ -1,87 +1,68 @@
 from pathlib import Path
 
 import json
-import os
-import sys
 import tempfile
 import unittest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from tarot_oracle.loaders import InvocationLoader, SpreadLoader
 
 
 class TestLoaders(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.spread_loader = SpreadLoader()
+
     def test_invocation_loader_basic(self):
         """Test InvocationLoader basic functionality with local files."""
         # Create temporary directory for testing
         with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-
-            try:
-                # Change to temp directory for local file testing
-                os.chdir(temp_dir)
-
-                # Create test invocation file
-                test_invocation = "By the ancient powers, I seek guidance through these cards."
-                inv_file = Path("test_invocation.txt")
-                inv_file.write_text(test_invocation)
+            # Create test invocation file
+            test_invocation = "By the ancient powers, I seek guidance through these cards."
+            inv_file = Path(temp_dir) / "test_invocation.txt"
+            inv_file.write_text(test_invocation)
 
-                # Test loading
-                from tarot_oracle.loaders import InvocationLoader
-                loader = InvocationLoader()
-                loaded = loader.load_invocation("test_invocation")
-                assert loaded == test_invocation, f"Expected '{test_invocation}', got '{loaded}'"
+            # Test loading
+            loader = InvocationLoader(base_path=Path(temp_dir))
+            loaded = loader.load_invocation("test_invocation")
+            assert loaded == test_invocation, f"Expected '{test_invocation}', got '{loaded}'"
 
-                # Test listing (empty, since we don't have global config dir set up)
-                invocations = loader.list_invocations()
-                assert isinstance(invocations, list), "Should return a list"
-
-            finally:
-                os.chdir(original_cwd)
+            # Test listing (empty, since we don't have global config dir set up)
+            invocations = loader.list_invocations()
+            assert isinstance(invocations, list), "Should return a list"
 
     def test_spread_loader_basic(self):
         """Test SpreadLoader basic functionality with local files."""
         # Create temporary directory for testing
         with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-
-            try:
-                # Change to temp directory for local file testing
-                os.chdir(temp_dir)
-
-                # Create test spread configuration
-                test_spread = {
-                    "name": "Test Spread",
-                    "description": "A simple test spread",
-                    "layout": [
-                        {"position": 1, "meaning": "Past"},
-                        {"position": 2, "meaning": "Present"},
-                        {"position": 3, "meaning": "Future"}
-                    ]
-                }
-
-                spread_file = Path("test_spread.json")
-                spread_file.write_text(json.dumps(test_spread, indent=2))
-
-                # Test loading
-                from tarot_oracle.loaders import SpreadLoader
-                loader = SpreadLoader()
-                loaded = loader.load_spread("test_spread")
-                assert loaded is not None, "Failed to load test spread"
-                assert loaded["name"] == "Test Spread", f"Expected name 'Test Spread', got '{loaded['name']}'"
-                assert len(loaded["layout"]) == 3, f"Expected 3 positions, got {len(loaded['layout'])}"
-
-                # Test listing (empty, since we don't have global config dir set up)
-                spreads = loader.list_spreads()
-                assert isinstance(spreads, list), "Should return a list"
-
-            finally:
-                os.chdir(original_cwd)
+            # Create test spread configuration
+            test_spread = {
+                "name": "Test Spread",
+                "description": "A simple test spread",
+                "layout": [
+                    {"position": 1, "meaning": "Past"},
+                    {"position": 2, "meaning": "Present"},
+                    {"position": 3, "meaning": "Future"}
+                ]
+            }
+
+            spread_file = Path(temp_dir) / "test_spread.json"
+            with open(spread_file, 'w', encoding='utf-8') as f:
+                json.dump(test_spread, f)
+
+            # Test loading
+            loader = SpreadLoader(base_path=Path(temp_dir))
+            loaded = loader.load_spread("test_spread")
+            assert loaded is not None, "Failed to load test spread"
+            assert loaded["name"] == "Test Spread", f"Expected name 'Test Spread', got '{loaded['name']}'"
+            assert len(loaded["layout"]) == 3, f"Expected 3 positions, got {len(loaded['layout'])}"
+
+            # Test listing (empty, since we don't have global config dir set up)
+            spreads = loader.list_spreads()
+            assert isinstance(spreads, list), "Should return a list"
 
     def test_spread_validation(self):
         """Test spread configuration validation."""
-        from tarot_oracle.loaders import SpreadLoader
-        loader = SpreadLoader()
+        loader = self.spread_loader
 
         # Test valid configuration
         valid_config = {
@@ -97,67 +78,42 @@ class TestLoaders(unittest.TestCase):
             "layout": [{"position": 1, "meaning": "Test"}]
         }
 
-        # Debug: let's see what actually happens
-        exception_caught = False
-        try:
+        with self.assertRaises(ValueError) as ctx:
             loader._validate_spread_config(invalid_config, "test")
-        except ValueError as e:
-            exception_caught = True
-            assert "name" in str(e), f"Error message should mention missing name, got: {e}"
-        except Exception as e:
-            self.fail(f"Expected ValueError, got {type(e).__name__}: {e}")
-
-        assert exception_caught, "ValueError should have been raised for missing name"
+        assert "name" in str(ctx.exception), f"Error message should mention missing name, got: {ctx.exception}"
 
-        # Test invalid semantic variable
+        # Test invalid semantic variable (placeholders are checked in matrix semantics)
         invalid_semantic = {
             "name": "Invalid Semantic",
-            "layout": [{"position": 1, "meaning": "Test"}],
-            "semantics": [{"rule": "When ${invalid} appears, something happens"}]
+            "layout": [[1]],
+            "semantics": [["When ${invalid} appears, something happens"]]
         }
 
-        # Debug: let's see what actually happens with semantic validation
-        semantic_exception_caught = False
-        try:
+        with self.assertRaises(ValueError) as ctx:
             loader._validate_spread_config(invalid_semantic, "test")
-        except ValueError as e:
-            semantic_exception_caught = True
-            assert "invalid" in str(e), f"Error message should mention invalid variable, got: {e}"
-        except Exception as e:
-            self.fail(f"Expected ValueError for semantic validation, got {type(e).__name__}: {e}")
-
-        # Note: semantic validation might not be implemented yet
-        # If no exception is raised, that's ok for now
+        assert "invalid" in str(ctx.exception), f"Error message should mention invalid variable, got: {ctx.exception}"
 
     def test_path_traversal_prevention(self):
         """Test that path traversal attacks are prevented."""
         # Create temporary directory for testing
         with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-
-            try:
-                # Change to temp directory for local file testing
-                os.chdir(temp_dir)
-
-                # Create malicious files outside current directory
-                Path("subdir").mkdir()
-                malicious_file = Path("subdir") / "malicious.txt"
-                malicious_file.write_text("This should not be accessible")
-
-                # Test invocation loader
-                from tarot_oracle.loaders import InvocationLoader
-                inv_loader = InvocationLoader()
-                result = inv_loader.load_invocation("../subdir/malicious")
-                assert result is None, "Path traversal should be prevented for invocation loader"
-
-                # Test spread loader
-                from tarot_oracle.loaders import SpreadLoader
-                spread_loader = SpreadLoader()
-                result = spread_loader.load_spread("../subdir/malicious")
-                assert result is None, "Path traversal should be prevented for spread loader"
-
-            finally:
-                os.chdir(original_cwd)
+            base_path = Path(temp_dir) / "base"
+            base_path.mkdir()
+
+            # Create malicious files outside the loaders' base directory
+            subdir = Path(temp_dir) / "subdir"
+            subdir.mkdir(parents=True, exist_ok=True)
+            (subdir / "malicious.txt").write_bytes(b"This should not be accessible")
+
+            # Test invocation loader
+            inv_loader = InvocationLoader(base_path=base_path)
+            result = inv_loader.load_invocation("../subdir/malicious")
+            assert result is None, "Path traversal should be prevented for invocation loader"
+
+            # Test spread loader
+            spread_loader = SpreadLoader(base_path=base_path)
+            result = spread_loader.load_spread("../subdir/malicious")
+            assert result is None, "Path traversal should be prevented for spread loader"
 
 
 if __name__ == "__main__":
@@ -2,16 +2,23 @@
 
 import unittest
 import json
-from unittest.mock import patch, Mock
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
 import requests
 
-import sys
-from pathlib import Path
+from tarot_oracle.oracle import OpenRouterClient, _TokenBucket
+# Custom exceptions removed - using standard TypeError and ValueError instead
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tarot_oracle.oracle import OpenRouterClient
-# Custom exceptions removed - using standard TypeError and ValueError instead
+def _response(status_code: int, body: dict | None = None, headers: dict | None = None, text: str = "") -> SimpleNamespace:
+    """Build a stand-in for requests.Response with only the fields the client reads."""
+    return SimpleNamespace(
+        status_code=status_code,
+        json=lambda: body,
+        headers=headers if headers is not None else {},
+        text=text,
+    )
 
 
 class TestOpenRouterClient(unittest.TestCase):
@@ -27,6 +34,7 @@ class TestOpenRouterClient(unittest.TestCase):
         assert client.api_key == api_key
         assert client.model == model
         assert client.base_url == "https://openrouter.ai/api/v1"
+        assert isinstance(client.session, requests.Session)
 
     def test_client_initialization_default_model(self):
         """Test client initialization with default model."""
@@ -37,13 +45,11 @@ class TestOpenRouterClient(unittest.TestCase):
         assert client.api_key == api_key
         assert client.model == "z-ai/glm-4.5-air:free"
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_successful_response(self, mock_post):
         """Test successful API response."""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [
                 {
                     "message": {
@@ -51,8 +57,7 @@ class TestOpenRouterClient(unittest.TestCase):
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         result = client.generate_response("Interpret these cards: Ace of Cups")
@@ -64,15 +69,14 @@ class TestOpenRouterClient(unittest.TestCase):
         call_args = mock_post.call_args
         assert "Authorization" in call_args[1]["headers"]
         assert call_args[1]["headers"]["Authorization"] == "Bearer test-key"
-        assert call_args[1]["json"]["model"] == "z-ai/glm-4.5-air:free"
-        assert call_args[1]["json"]["messages"][0]["content"] == "Interpret these cards: Ace of Cups"
+        payload = json.loads(call_args[1]["data"])
+        assert payload["model"] == "z-ai/glm-4.5-air:free"
+        assert payload["messages"][0]["content"] == "Interpret these cards: Ace of Cups"
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_successful_response_with_model_override(self, mock_post):
         """Test successful response with model override."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [
                 {
                     "message": {
@@ -80,8 +84,7 @@ class TestOpenRouterClient(unittest.TestCase):
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         result = client.generate_response("Test prompt", model="custom/model")
@@ -90,160 +93,53 @@ class TestOpenRouterClient(unittest.TestCase):
 
         # Verify model override was used
         call_args = mock_post.call_args
-        assert call_args[1]["json"]["model"] == "custom/model"
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_authentication_error(self, mock_post):
-        """Test authentication error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="invalid-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert "Invalid OpenRouter API key" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_rate_limit_error(self, mock_post):
-        """Test rate limit error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "60"}
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert "OpenRouter API rate limit exceeded" in str(exc_info.exception)
-        assert "Retry after: 60" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_rate_limit_error_without_retry_after(self, mock_post):
-        """Test rate limit error without Retry-After header."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {}
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert exc_info.exception is not None
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_network_timeout_error(self, mock_post):
-        """Test network timeout error handling."""
-        mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt", timeout=10)
-
-        assert "OpenRouter API request timed out after 10 seconds" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_network_connection_error(self, mock_post):
-        """Test network connection error handling."""
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert "OpenRouter API request failed" in str(exc_info.exception)
-        assert "Connection failed" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_invalid_response_format(self, mock_post):
-        """Test handling of invalid response format."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"invalid": "format"}
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert "Invalid response format from OpenRouter" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_empty_response_content(self, mock_post):
-        """Test handling of empty response content."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": ""
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-        result = client.generate_response("Test prompt")
-
-        assert result is None
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_none_response_content(self, mock_post):
-        """Test handling of None response content."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": None
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-        result = client.generate_response("Test prompt")
-
-        assert result is None
-
-    @patch('tarot_oracle.oracle.requests.post')
-    def test_unexpected_http_status(self, mock_post):
-        """Test handling of unexpected HTTP status codes."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal server error"
-        mock_post.return_value = mock_response
-
-        client = OpenRouterClient(api_key="test-key")
-
-        with self.assertRaises(ValueError) as exc_info:
-            client.generate_response("Test prompt")
-
-        assert "OpenRouter API returned status 500" in str(exc_info.exception)
-        assert "Internal server error" in str(exc_info.exception)
-
-    @patch('tarot_oracle.oracle.requests.post')
+        assert json.loads(call_args[1]["data"])["model"] == "custom/model"
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_error_responses(self, mock_post):
+        """Test each failure mode raises ValueError with a descriptive message."""
+        cases = [
+            ("authentication", {"return_value": _response(401)}, ["Invalid OpenRouter API key"]),
+            ("rate limit", {"return_value": _response(429, headers={"Retry-After": "60"})},
+                ["OpenRouter API rate limit exceeded", "Retry after: 60"]),
+            ("rate limit without Retry-After", {"return_value": _response(429)}, ["OpenRouter API rate limit exceeded"]),
+            ("timeout", {"side_effect": requests.exceptions.Timeout("Request timed out")},
+                ["OpenRouter API request timed out after 10 seconds"]),
+            ("connection", {"side_effect": requests.exceptions.ConnectionError("Connection failed")},
+                ["OpenRouter API request failed", "Connection failed"]),
+            ("invalid format", {"return_value": _response(200, {"invalid": "format"})},
+                ["Invalid response format from OpenRouter"]),
+            ("unexpected status", {"return_value": _response(500, text="Internal server error")},
+                ["OpenRouter API returned status 500", "Internal server error"]),
+        ]
+
+        for name, post_behaviour, fragments in cases:
+            with self.subTest(case=name):
+                mock_post.reset_mock(return_value=True, side_effect=True)
+                mock_post.configure_mock(**post_behaviour)
+                client = OpenRouterClient(api_key="test-key")
+
+                with self.assertRaises(ValueError) as exc_info:
+                    client.generate_response("Test prompt", timeout=10)
+
+                for fragment in fragments:
+                    assert fragment in str(exc_info.exception), f"Expected '{fragment}' in: {exc_info.exception}"
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_blank_response_content(self, mock_post):
+        """Test empty or None message content returns None."""
+        for content in ("", None):
+            with self.subTest(content=content):
+                mock_post.return_value = _response(200, {"choices": [{"message": {"content": content}}]})
+                client = OpenRouterClient(api_key="test-key")
+                assert client.generate_response("Test prompt") is None
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_request_headers(self, mock_post):
         """Test that correct headers are sent with requests."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key", model="test-model")
         client.generate_response("Test prompt")
@@ -256,21 +152,18 @@ class TestOpenRouterClient(unittest.TestCase):
         assert headers["HTTP-Referer"] == "https://github.com/tarot-oracle/tarot-oracle"
         assert headers["X-Title"] == "Tarot Oracle"
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_request_payload_structure(self, mock_post):
         """Test that request payload has correct structure."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         client.generate_response("Test prompt", model="custom/model", timeout=45)
 
         call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
 
         assert payload["model"] == "custom/model"
         assert payload["max_tokens"] == 2048
@@ -279,15 +172,25 @@ class TestOpenRouterClient(unittest.TestCase):
         assert payload["messages"][0]["role"] == "user"
         assert payload["messages"][0]["content"] == "Test prompt"
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_request_payload_escapes_prompt(self, mock_post):
+        """Test prompts with quotes, newlines and non-ASCII text survive encoding."""
+        mock_post.return_value = _response(200, {"choices": [{"message": {"content": "Test response"}}]})
+        prompt = 'Ask "the Tower"\n\tthen \\ the Star ✶'
+
+        client = OpenRouterClient(api_key="test-key", model='odd"model')
+        client.generate_response(prompt)
+
+        payload = json.loads(mock_post.call_args[1]["data"])
+        assert payload["model"] == 'odd"model'
+        assert payload["messages"] == [{"role": "user", "content": prompt}]
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_custom_timeout_parameter(self, mock_post):
         """Test custom timeout parameter is passed through."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         client.generate_response("Test prompt", timeout=60)
@@ -295,16 +198,82 @@ class TestOpenRouterClient(unittest.TestCase):
         call_args = mock_post.call_args
         assert call_args[1]["timeout"] == 60
 
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_generate_responses_preserves_order(self, mock_post):
+        """Test batched prompts return one result per prompt, in order."""
+        def respond(url, data, headers, timeout):
+            prompt = json.loads(data)['messages'][0]['content']
+            return _response(200, {
+                "choices": [{"message": {"content": f"Echo: {prompt}"}}]
+            })
+        mock_post.side_effect = respond
+
+        client = OpenRouterClient(api_key="test-key")
+        prompts = [f"Prompt {i}" for i in range(5)]
+        results = client.generate_responses(prompts, concurrency=3)
+
+        assert results == [f"Echo: {prompt}" for prompt in prompts]
+        assert mock_post.call_count == len(prompts)
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_generate_responses_raises_first_error(self, mock_post):
+        """Test a failing prompt in a batch raises its ValueError to the caller."""
+        def respond(url, data, headers, timeout):
+            prompt = json.loads(data)['messages'][0]['content']
+            if prompt == "Prompt 2":
+                return _response(401)
+            return _response(200, {"choices": [{"message": {"content": f"Echo: {prompt}"}}]})
+        mock_post.side_effect = respond
+
+        client = OpenRouterClient(api_key="test-key")
+        with self.assertRaises(ValueError) as exc_info:
+            client.generate_responses([f"Prompt {i}" for i in range(5)], concurrency=3)
+
+        assert "Invalid OpenRouter API key" in str(exc_info.exception)
+
+    def test_session_is_per_thread(self):
+        """Test each thread gets its own Session while a thread reuses its own."""
+        client = OpenRouterClient(api_key="test-key")
+        assert client.session is client.session, "Same thread should reuse its session"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(lambda: client.session).result()
+
+        assert isinstance(other, requests.Session)
+        assert other is not client.session, "Another thread should get its own session"
+
+    @patch('tarot_oracle.oracle.time.sleep')
+    def test_rate_limiter_throttles_after_burst(self, mock_sleep):
+        """Test the token bucket only sleeps once the burst is used up."""
+        bucket = _TokenBucket(rate=1.0, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 1.0
+
+    @patch('tarot_oracle.oracle.requests.Session.post')
+    def test_rate_limit_error_drains_limiter(self, mock_post):
+        """Test a 429 response empties the client-side token bucket."""
+        mock_post.return_value = _response(429, headers={})
+
+        client = OpenRouterClient(api_key="test-key")
+        with self.assertRaises(ValueError):
+            client.generate_response("Test prompt")
+
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.tokens <= 0
+
 
 class TestOpenRouterIntegration:
     """Test OpenRouter integration scenarios."""
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_tarot_interpretation_scenario(self, mock_post):
         """Test realistic tarot interpretation scenario."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [
                 {
                     "message": {
@@ -312,8 +281,7 @@ class TestOpenRouterIntegration:
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         prompt = "Please interpret this tarot card: Ace of Cups in the position of 'Current Situation'"
@@ -324,12 +292,10 @@ class TestOpenRouterIntegration:
         assert "emotional" in result.lower()
         mock_post.assert_called_once()
 
-    @patch('tarot_oracle.oracle.requests.post')
+    @patch('tarot_oracle.oracle.requests.Session.post')
     def test_multiple_card_reading_scenario(self, mock_post):
         """Test interpretation of multiple card reading."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _response(200, {
             "choices": [
                 {
                     "message": {
@@ -337,8 +303,7 @@ class TestOpenRouterIntegration:
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
 
         client = OpenRouterClient(api_key="test-key")
         prompt = """
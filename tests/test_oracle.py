@@ -4,12 +4,8 @@ import unittest
 import os
 import tempfile
 import json
-from pathlib import Path
 from unittest.mock import patch
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from tarot_oracle.config import Config, config
 
 
@@ -49,6 +45,14 @@ class TestOracle(unittest.TestCase):
         assert "?" not in safe_filename, "Filename should not contain '?'"
         assert "@" not in safe_filename, "Filename should not contain '@'"
 
+    def test_session_filename_strips_unsafe_characters(self):
+        """Test that card codes are reduced to ASCII letters and digits."""
+        from tarot_oracle.oracle import generate_session_filename
+
+        filename = generate_session_filename(["W_A", "../C/2", "é?@Ⅻ", "\t5\n"])
+        codes = filename[len("YYYY-MM-DD-HHMMSS-"):-len(".md")]
+        assert codes == "WA-C2--5", f"Expected sanitized codes 'WA-C2--5', got {codes!r}"
+
 
 if __name__ == "__main__":
     unittest.main()
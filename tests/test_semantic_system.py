@@ -2,10 +2,8 @@
 
 import unittest
 import json
+import tempfile
 from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tarot_oracle.tarot import SemanticAdapter, SpreadLoader, Card
 from tarot_oracle.loaders import SpreadLoader as SpreadLoaderClass
@@ -34,6 +32,23 @@ class TestSemanticAdapter(unittest.TestCase):
         assert "Emotional Basis/Subconscious Influences (Water)" in resolved
         assert "Nature of Circumstances/Divine Will (Spirit)" in resolved
 
+    def test_semantics_resolution_is_shared(self):
+        """Test that adapters with the same semantics reuse resolution but not rows."""
+        from tarot_oracle.tarot import _resolve_semantics
+
+        semantics = [['${fire} rising', None]]
+        groups = {'fire': 'Karmic Forces (Fire)'}
+        card = Card('Test', 'major', None, '0', 'Test')
+
+        first = SemanticAdapter([[1, 2]], [card], semantics, groups)
+        hits = _resolve_semantics.cache_info().hits
+        second = SemanticAdapter([[1, 2]], [card], semantics, groups)
+
+        assert _resolve_semantics.cache_info().hits == hits + 1, "Second adapter should hit the cache"
+        assert first.semantics == [['Karmic Forces (Fire) rising', None]]
+        first.semantics[0][0] = 'changed'
+        assert second.semantics[0][0] == 'Karmic Forces (Fire) rising', "Adapters should not share rows"
+
     def test_semantic_adapter_with_custom_spread(self):
         """Test SemanticAdapter with custom spread semantics."""
         config = {
@@ -157,7 +172,6 @@ class TestSpreadLoaderEnhancements(unittest.TestCase):
 
     def test_integration_with_real_files(self):
         """Test integration with real spread files."""
-        # Create temporary test files in current directory (where SpreadLoader can find them)
         test_spread = {
             "name": "Integration Test Spread",
             "description": "Test spread for integration",
@@ -171,20 +185,21 @@ class TestSpreadLoaderEnhancements(unittest.TestCase):
             ]
         }
 
-        temp_path = Path.cwd() / 'test_integration_spread.json'
-
-        try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(Path(temp_dir) / 'test_integration_spread.json', 'w', encoding='utf-8') as f:
                 json.dump(test_spread, f)
 
             # Test loading with SpreadLoader
-            loader = SpreadLoader()
+            loader = SpreadLoader(base_path=Path(temp_dir))
             spread = loader.load_spread('test_integration_spread')
 
             assert spread is not None
             assert spread['name'] == 'Integration Test Spread'
             assert 'semantic_groups' in spread
             assert 'guidance' in spread
+            with self.assertRaises(TypeError):
+                spread['name'] = 'Mutated'
+            assert loader.load_spread('test_integration_spread')['name'] == 'Integration Test Spread', "Cached spread should be unchanged"
 
             # Test with SemanticAdapter
             cards = [
@@ -198,11 +213,6 @@ class TestSpreadLoaderEnhancements(unittest.TestCase):
 
             assert len(legend) > 0
 
-        finally:
-            # Clean up
-            if temp_path.exists():
-                temp_path.unlink()
-
 
 class TestZodiacSpreads(unittest.TestCase):
     """Test specific Zodiac spread implementations."""
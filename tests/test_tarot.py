@@ -4,17 +4,19 @@ import unittest
 import os
 import tempfile
 import json
+import re
 from pathlib import Path
 from unittest.mock import patch
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from tarot_oracle.tarot import DeckLoader
+from tarot_oracle.tarot import Card, Deck, DeckLoader, DeterministicRNG
 from tarot_oracle.config import Config, config
 
 
 class TestTarot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.deck_loader = DeckLoader()
+
     def test_config_decks_dir_exists(self):
         """Test that the config's decks directory exists."""
         # This should work with the actual user's config
@@ -24,10 +26,6 @@ class TestTarot(unittest.TestCase):
 
     def test_deck_loader_search_paths(self):
         """Test that DeckLoader uses the correct search paths."""
-        from tarot_oracle.tarot import DeckLoader
-        import re
-
-        deck_loader = DeckLoader()
         test_filename = "test_deck"
 
         # Simulate the filename sanitization
@@ -47,8 +45,6 @@ class TestTarot(unittest.TestCase):
 
     def test_deck_loader_security(self):
         """Test that DeckLoader prevents path traversal."""
-        deck_loader = DeckLoader()
-
         # Test malicious filenames
         malicious_names = [
             "../../../etc/passwd",
@@ -58,41 +54,91 @@ class TestTarot(unittest.TestCase):
         ]
 
         for name in malicious_names:
-            resolved = deck_loader.resolve_deck_path(name)
-            assert resolved is None, f"Should reject malicious filename: {name}"
+            with self.subTest(name=name):
+                resolved = self.deck_loader.resolve_deck_path(name)
+                assert resolved is None, f"Should reject malicious filename: {name}"
 
     def test_deck_loader_with_real_deck(self):
         """Test DeckLoader with an actual deck file in the config directory."""
-        # Create a minimal test deck in the actual config directory
         test_deck = {
             "name": "Unit Test Deck",
             "description": "Temporary deck for testing",
             "cards": ["W_A", "W_2", "W_3"]
         }
 
-        deck_file = config.decks_dir / "unit_test_deck.json"
-
-        try:
-            # Create the test deck file
-            with open(deck_file, 'w', encoding='utf-8') as f:
-                json.dump(test_deck, f)
-
-            # Test that the deck loader can find it
-            deck_loader = DeckLoader()
-            resolved = deck_loader.resolve_deck_path("unit_test_deck")
-
-            assert resolved is not None, "Should resolve the test deck"
-            assert resolved.endswith("unit_test_deck.json"), "Should resolve to correct filename"
-
-            # Test that the deck can be loaded
-            deck_config = DeckLoader.load_deck_config(resolved)
-            assert deck_config["name"] == "Unit Test Deck", f"Expected 'Unit Test Deck', got {deck_config['name']}"
-            assert deck_config["cards"] == ["W_A", "W_2", "W_3"], f"Expected ['W_A', 'W_2', 'W_3'], got {deck_config['cards']}"
-
-        finally:
-            # Clean up the test file
-            if deck_file.exists():
-                deck_file.unlink()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            decks_dir = Path(temp_dir).resolve()
+            with patch.object(config, 'decks_dir', decks_dir), patch.object(config, 'home_dir', decks_dir):
+                with open(decks_dir / "unit_test_deck.json", 'w', encoding='utf-8') as f:
+                    json.dump(test_deck, f)
+
+                # Test that the deck loader can find it
+                resolved = self.deck_loader.resolve_deck_path("unit_test_deck")
+
+                assert resolved is not None, "Should resolve the test deck"
+                assert resolved.endswith("unit_test_deck.json"), "Should resolve to correct filename"
+
+                # Test that the deck can be loaded
+                deck_config = DeckLoader.load_deck_config(resolved)
+                assert deck_config["name"] == "Unit Test Deck", f"Expected 'Unit Test Deck', got {deck_config['name']}"
+                assert deck_config["cards"] == ["W_A", "W_2", "W_3"], f"Expected ['W_A', 'W_2', 'W_3'], got {deck_config['cards']}"
+
+    def test_load_deck_config_cache_follows_file_changes(self):
+        """Test that repeat loads hit the cache until the deck file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            deck_file = Path(temp_dir) / "cached_deck.json"
+            deck_file.write_text(json.dumps({"name": "First"}), encoding='utf-8')
+
+            first = DeckLoader.load_deck_config(str(deck_file))
+            assert DeckLoader.load_deck_config(str(deck_file)) is first, "Unchanged file should be served from cache"
+            with self.assertRaises(TypeError):
+                first["name"] = "Mutated"
+
+            deck_file.write_text(json.dumps({"name": "Second deck"}), encoding='utf-8')
+            second = DeckLoader.load_deck_config(str(deck_file))
+            assert second["name"] == "Second deck", f"Expected reload after change, got {second['name']}"
+
+    def test_card_is_slotted(self):
+        """Test that Card instances carry no per-instance __dict__."""
+        card = Card('The Tower', 'major', None, 'XVI', 'Upheaval')
+        assert not hasattr(card, '__dict__'), "Card should use __slots__"
+        card.is_reversed = True
+        assert card.get_keywords() == 'Upheaval', "Reversed card without reversed keywords should fall back"
+
+    def test_deterministic_rng_accepts_seed_bytes(self):
+        """Test that bytes and int seeds produce the same sequence."""
+        seed_bytes = bytes(range(32))
+        seed_int = int.from_bytes(seed_bytes, 'little')
+        rng_bytes = DeterministicRNG(seed_bytes)
+        rng_int = DeterministicRNG(seed_int)
+        assert [rng_bytes.next_int(78) for _ in range(10)] == [rng_int.next_int(78) for _ in range(10)]
+
+    def test_shuffle_is_deterministic_for_seed(self):
+        """Test that the same seed always yields the same order and reversals."""
+        deck = Deck.__new__(Deck)
+        deck.cards = [Card(str(i), 'major', None, str(i), '') for i in range(22)]
+
+        deck.shuffle_and_assign_reversals(DeterministicRNG(12345), allow_reversed=True)
+        first = [(card.name, card.is_reversed) for card in deck.shuffled]
+        deck.shuffle_and_assign_reversals(DeterministicRNG(12345), allow_reversed=True)
+        second = [(card.name, card.is_reversed) for card in deck.shuffled]
+
+        assert first == second, "Same seed should produce the same shuffle"
+        assert sorted(name for name, _ in first) == sorted(card.name for card in deck.cards), "Shuffle should be a permutation"
+
+    def test_shuffle_matches_known_order_for_seed(self):
+        """Test that a fixed seed yields a fixed, known draw order and reversals."""
+        deck = Deck.__new__(Deck)
+        deck.cards = [Card(str(i), 'major', None, str(i), '') for i in range(8)]
+
+        deck.shuffle_and_assign_reversals(DeterministicRNG(12345), allow_reversed=True)
+        drawn = [(card.name, card.is_reversed) for card in deck.shuffled]
+
+        expected = [
+            ('1', True), ('0', False), ('5', True), ('2', False),
+            ('3', True), ('4', False), ('7', True), ('6', False),
+        ]
+        assert drawn == expected, f"Draw sequence changed for seed 12345: {drawn}"
 
 
 if __name__ == "__main__":